@@ -10,6 +10,10 @@ from typing import Literal
 
 from nest.core.exceptions import ModelError
 
+# Cache directories already confirmed to hold the models. Only positive results
+# are remembered, so a probe after a fresh download still flips to True.
+_VERIFIED_CACHE_DIRS: set[Path] = set()
+
 
 def _get_docling_settings():
     """Lazy import of docling settings to avoid top-level import crash."""
@@ -60,15 +64,21 @@ class DoclingModelDownloader:
     def are_models_cached(self) -> bool:
         """Check if required models are already cached.
 
+        A positive result is remembered for the rest of the process, so
+        repeated calls skip the filesystem probes.
+
         Returns:
             True if all required model folders exist, False otherwise.
         """
         cache_dir = self.get_cache_path()
+        if cache_dir in _VERIFIED_CACHE_DIRS:
+            return True
 
         for folder in self.REQUIRED_CACHE_FOLDERS:
             if not (cache_dir / folder).exists():
                 return False
 
+        _VERIFIED_CACHE_DIRS.add(cache_dir)
         return True
 
     def download_if_needed(self, progress: bool = True) -> bool:
@@ -157,6 +167,7 @@ class DoclingModelDownloader:
     def _cleanup_partial_download(self) -> None:
         """Clean up partial downloads on failure."""
         cache_dir = self.get_cache_path()
+        _VERIFIED_CACHE_DIRS.discard(cache_dir)
         if cache_dir.exists():
             shutil.rmtree(cache_dir, ignore_errors=True)
 
@@ -3,6 +3,11 @@
 Wraps IBM Docling for converting documents to Markdown.
 """
 
+import functools
+import multiprocessing
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from docling.datamodel.base_models import InputFormat
@@ -17,6 +22,13 @@ from docling_core.types.doc.base import ImageRefMode
 
 from nest.core.models import ProcessingResult
 
+# Every batch worker loads its own copy of the layout/TableFormer models, so
+# the default pool stays small regardless of core count.
+_DEFAULT_MAX_WORKERS = 4
+
+# Intra-op threads per worker; workers x threads should not exceed the cores.
+_WORKER_THREADS = 2
+
 
 class DoclingProcessor:
     """Document processor using IBM Docling for conversion.
@@ -36,7 +48,11 @@ class DoclingProcessor:
         InputFormat.HTML,
     ]
 
-    def __init__(self, enable_classification: bool = False) -> None:
+    def __init__(
+        self,
+        enable_classification: bool = False,
+        max_workers: int | None = None,
+    ) -> None:
         """Initialize Docling converter with optimal settings.
 
         Args:
@@ -44,41 +60,23 @@ class DoclingProcessor:
                 classifier during conversion. Required for the two-pass image
                 pipeline (stories 7.2+). Defaults to False for backward
                 compatibility.
+            max_workers: Default worker process count for ``process_batch``.
+                None picks a small bound from the CPU count.
         """
         self._enable_classification = enable_classification
+        self._max_workers = max_workers
 
-        # Configure table structure with TableFormer ACCURATE mode and cell matching
-        table_structure_options = TableStructureOptions(
-            do_cell_matching=True,
-            mode=TableFormerMode.ACCURATE,
-        )
+        # Converters are shared per configuration so extra processor instances
+        # reuse already-loaded layout/TableFormer weights.
+        self._converter = _make_converter(enable_classification)
 
-        if enable_classification:
-            # Classification-enabled pipeline: activates local image classifier
-            # and image extraction for the two-pass vision LLM pipeline.
-            # do_picture_description=False because Pass 2 is handled by
-            # PictureDescriptionService (story 7.3) using type-specific prompts.
-            pipeline_options = PdfPipelineOptions(
-                do_table_structure=True,
-                table_structure_options=table_structure_options,
-                do_picture_classification=True,
-                do_picture_description=False,
-                generate_picture_images=True,
-                images_scale=2.0,
-            )
-        else:
-            # Standard pipeline: table extraction only, no image processing.
-            pipeline_options = PdfPipelineOptions(
-                do_table_structure=True,
-                table_structure_options=table_structure_options,
-            )
+    @classmethod
+    def release_models(cls) -> None:
+        """Drop the shared converters so their models can be freed.
 
-        self._converter = DocumentConverter(
-            allowed_formats=self.SUPPORTED_FORMATS,
-            format_options={
-                InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options),
-            },
-        )
+        Subsequent processors build (and load models for) fresh converters.
+        """
+        _make_converter.cache_clear()
 
     def convert(self, source: Path) -> ConversionResult:
         """Run Pass 1 of the two-pass image pipeline.
@@ -130,11 +128,16 @@ class DoclingProcessor:
                 image_mode=ImageRefMode.PLACEHOLDER,
             )
 
-            # Ensure output directory exists
-            output.parent.mkdir(parents=True, exist_ok=True)
+            # Encode once and drop the str so only one full copy stays alive
+            data = markdown_content.encode("utf-8")
+            del markdown_content
 
-            # Write markdown output
-            output.write_text(markdown_content, encoding="utf-8", newline="\n")
+            # Most outputs land in an existing directory; only mkdir on a miss
+            try:
+                output.write_bytes(data)
+            except FileNotFoundError:
+                output.parent.mkdir(parents=True, exist_ok=True)
+                output.write_bytes(data)
 
             return ProcessingResult(
                 source_path=source,
@@ -149,3 +152,139 @@ class DoclingProcessor:
                 status="failed",
                 error=error_msg,
             )
+
+    def process_batch(
+        self,
+        jobs: Sequence[tuple[Path, Path]],
+        max_workers: int | None = None,
+    ) -> Iterator[ProcessingResult]:
+        """Convert many documents to Markdown across worker processes.
+
+        Conversion is CPU-bound and every file is independent, so jobs are
+        fanned out over a ``ProcessPoolExecutor``. Each worker process builds
+        its converter once and reuses it (and its loaded models) for every
+        job it receives.
+
+        Results are yielded in input order as they complete, so callers can
+        report progress while later files are still converting. Batches of a
+        single file (or ``max_workers=1``) are processed in-process to avoid
+        paying worker start-up and model load for no parallelism.
+
+        Each worker holds its own models, so the default pool is capped at
+        four processes (fewer on small machines), and every worker is pinned
+        to two intra-op threads to keep the CPU from being oversubscribed.
+
+        Args:
+            jobs: ``(source, output)`` pairs, as passed to ``process()``.
+            max_workers: Maximum worker processes. Defaults to the value given
+                at construction, else :func:`_default_max_workers`.
+
+        Yields:
+            One ProcessingResult per job, in the same order as ``jobs``.
+        """
+        workers = min(len(jobs), max_workers or self._max_workers or _default_max_workers())
+        if workers <= 1:
+            for source, output in jobs:
+                yield self.process(source, output)
+            return
+
+        # "spawn" avoids forking a parent that may already hold torch threads.
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(_WORKER_THREADS,),
+        )
+        try:
+            futures = [
+                executor.submit(_worker, source, output, self._enable_classification)
+                for source, output in jobs
+            ]
+            for (source, _), future in zip(jobs, futures, strict=True):
+                try:
+                    yield future.result()
+                except Exception as e:
+                    # Worker crashed (e.g. killed for memory) — report per file
+                    yield ProcessingResult(
+                        source_path=source,
+                        status="failed",
+                        error=str(e) or type(e).__name__,
+                    )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+@functools.cache
+def _make_converter(enable_classification: bool) -> DocumentConverter:
+    """Build the Docling converter for a pipeline configuration.
+
+    Cached per process: Docling loads layout/TableFormer weights lazily on a
+    converter's first ``convert()``, so sharing one converter per
+    configuration means models are loaded only once.
+
+    Args:
+        enable_classification: Whether the image classification pipeline is on.
+
+    Returns:
+        Configured DocumentConverter.
+    """
+    # Configure table structure with TableFormer ACCURATE mode and cell matching
+    table_structure_options = TableStructureOptions(
+        do_cell_matching=True,
+        mode=TableFormerMode.ACCURATE,
+    )
+
+    if enable_classification:
+        # Classification-enabled pipeline: activates local image classifier
+        # and image extraction for the two-pass vision LLM pipeline.
+        # do_picture_description=False because Pass 2 is handled by
+        # PictureDescriptionService (story 7.3) using type-specific prompts.
+        pipeline_options = PdfPipelineOptions(
+            do_table_structure=True,
+            table_structure_options=table_structure_options,
+            do_picture_classification=True,
+            do_picture_description=False,
+            generate_picture_images=True,
+            images_scale=2.0,
+        )
+    else:
+        # Standard pipeline: table extraction only, no image processing.
+        pipeline_options = PdfPipelineOptions(
+            do_table_structure=True,
+            table_structure_options=table_structure_options,
+        )
+
+    return DocumentConverter(
+        allowed_formats=DoclingProcessor.SUPPORTED_FORMATS,
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options),
+        },
+    )
+
+
+def _default_max_workers() -> int:
+    """Return the default batch pool size for this machine."""
+    return max(1, min(_DEFAULT_MAX_WORKERS, (os.cpu_count() or 1) // _WORKER_THREADS))
+
+
+def _init_worker(num_threads: int) -> None:
+    """Limit a batch worker's intra-op threads before it builds a converter.
+
+    Docling sizes its accelerator threads from ``OMP_NUM_THREADS`` when the
+    converter is created, which happens on the worker's first job. torch may
+    already be imported, so its pool is set directly as well.
+    """
+    os.environ["OMP_NUM_THREADS"] = str(num_threads)
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(num_threads)
+
+
+def _worker(source: Path, output: Path, enable_classification: bool) -> ProcessingResult:
+    """Process a single job inside a ``process_batch`` worker process.
+
+    The converter cache keeps models loaded across jobs in the same worker.
+    """
+    return DoclingProcessor(enable_classification=enable_classification).process(source, output)
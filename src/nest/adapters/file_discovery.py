@@ -8,6 +8,7 @@ import logging
 import os
 from pathlib import Path
 
+from nest.adapters.filesystem import walk_entries
 from nest.adapters.protocols import FileDiscoveryProtocol
 
 logger = logging.getLogger(__name__)
@@ -36,37 +37,31 @@ class FileDiscoveryAdapter(FileDiscoveryProtocol):
             Sorted list of absolute paths to discovered files.
             Sorting ensures deterministic ordering.
         """
-        # Normalize extensions to lowercase for case-insensitive matching
-        normalized_extensions = {ext.lower() for ext in extensions}
+        # Normalize extensions once into a tuple for C-level str.endswith()
+        ext_suffixes = tuple({ext.lower() for ext in extensions})
 
         discovered: list[Path] = []
 
-        for path in directory.rglob("*"):
-            # Warn about broken symlinks (target missing) and skip them.
-            # is_symlink() does not follow the link; exists() does.
-            if path.is_symlink() and not path.exists():
-                logger.warning("Skipping broken symlink: %s", path)
+        # Single scandir pass; hidden directories are pruned before descending.
+        # walk_entries yields in sorted order, so no final sort is needed.
+        for entry in walk_entries(os.path.abspath(directory), skip_hidden_dirs=True):
+            # Check extension first: it needs no syscall. Names are usually
+            # lowercase already, so only lower() them when the fast check misses.
+            name = entry.name
+            if not (name.endswith(ext_suffixes) or name.lower().endswith(ext_suffixes)):
                 continue
 
-            # Ensure it's a regular file (skips directories, sockets, devices, etc.)
+            # Ensure it's a regular file (skips sockets, devices, etc.)
             # is_file() follows symlinks, so symlinked files are accepted.
-            if not path.is_file():
+            if not entry.is_file():
+                # Warn about broken symlinks (target missing) and skip them.
+                if entry.is_symlink() and not os.path.exists(entry.path):
+                    logger.warning("Skipping broken symlink: %s", entry.path)
                 continue
 
-            # Skip hidden files (name starts with .)
-            if path.name.startswith("."):
-                continue
-
-            # Skip files in hidden directories
-            if any(part.startswith(".") for part in path.relative_to(directory).parts):
-                continue
-
-            # Check extension (case-insensitive)
-            if path.suffix.lower() in normalized_extensions:
-                # Use abspath() rather than resolve() so symlinks remain under
-                # the sources directory (resolve() would dereference the link
-                # to its real location, breaking relative_to(sources_dir)).
-                discovered.append(Path(os.path.abspath(path)))
+            # entry.path is already absolute; symlinks are left un-dereferenced
+            # so they remain under the sources directory (resolve() would
+            # break relative_to()).
+            discovered.append(Path(entry.path))
 
-        # Sort for deterministic ordering
-        return sorted(discovered)
+        return discovered
@@ -3,11 +3,103 @@
 Handles directory and file operations for the project.
 """
 
+import os
+import shutil
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 
 from nest.core.paths import mirror_path
 
 
+def _sorted_scandir(path: str) -> list[os.DirEntry[str]]:
+    """Read a directory's entries sorted the way ``Path`` objects compare."""
+    try:
+        with os.scandir(path) as entries:
+            return sorted(entries, key=lambda entry: os.path.normcase(entry.name))
+    except OSError:
+        # Unreadable or vanished directory
+        return []
+
+
+def walk_entries(root: str | Path, *, skip_hidden_dirs: bool = False) -> Iterator[os.DirEntry[str]]:
+    """Yield every non-directory entry under ``root`` in a single scandir pass.
+
+    DirEntry objects carry the file type from the directory read and cache
+    ``stat()`` on first use, so callers that need metadata never re-stat.
+    Hidden entries (name starts with '.') are not yielded; hidden directories
+    are still descended into unless ``skip_hidden_dirs`` is set. Symlinked
+    directories are not followed, and unreadable directories are skipped.
+
+    Each directory is sorted by name and descended into at its sorted
+    position, so entries come out in the same order as ``sorted()`` over
+    their paths without a global sort.
+
+    Args:
+        root: Directory to walk. Yielded paths are joined onto it as given.
+        skip_hidden_dirs: Prune directories whose name starts with '.'.
+
+    Yields:
+        DirEntry for each file, symlink, or other non-directory entry.
+    """
+    stack = [iter(_sorted_scandir(os.fspath(root)))]
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+            continue
+        hidden = entry.name.startswith(".")
+        if entry.is_dir(follow_symlinks=False):
+            if not (hidden and skip_hidden_dirs):
+                stack.append(iter(_sorted_scandir(entry.path)))
+        elif not hidden:
+            yield entry
+
+
+def _copy_file_range(src: Path, dst: Path) -> bool:
+    """Copy file contents with os.copy_file_range.
+
+    The kernel moves the data without user-space buffers and may share
+    extents outright (reflink) on filesystems such as Btrfs and XFS.
+
+    Returns:
+        True if the whole file was copied, False if the kernel stopped short.
+
+    Raises:
+        OSError: If copy_file_range is unsupported for these files.
+    """
+    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if copied == 0:
+                return False
+            remaining -= copied
+    return True
+
+
+def copy_file(src: Path, dst: Path) -> None:
+    """Copy a file's contents and metadata without staging it in Python.
+
+    Tries ``os.copy_file_range`` first where available, then falls back to
+    ``shutil.copyfile`` (which uses ``sendfile`` on Linux). Metadata is
+    copied afterwards, matching ``shutil.copy2``.
+
+    Args:
+        src: Path to the file to copy.
+        dst: Destination file path. Its parent directory must exist.
+    """
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        try:
+            copied = _copy_file_range(src, dst)
+        except OSError:
+            # EXDEV, ENOSYS, EINVAL, ... — let shutil pick the next best path
+            copied = False
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
 class FileSystemAdapter:
     """Adapter for filesystem operations.
 
@@ -24,13 +116,19 @@ class FileSystemAdapter:
         path.mkdir(parents=True, exist_ok=True)
 
     def write_text(self, path: Path, content: str) -> None:
-        """Write text content to a file.
+        """Write text content to a file, creating parent directories as needed.
 
         Args:
             path: Path to the file to write.
             content: Text content to write.
         """
-        path.write_text(content, encoding="utf-8", newline="\n")
+        try:
+            path.write_text(content, encoding="utf-8", newline="\n")
+        except FileNotFoundError:
+            # Parent is missing: create it only on this miss, so the common
+            # case stays a single open+write with no stat beforehand
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8", newline="\n")
 
     def read_text(self, path: Path) -> str:
         """Read text content from a file.
@@ -57,6 +155,44 @@ class FileSystemAdapter:
         """
         return path.exists()
 
+    def exists_many(self, paths: Sequence[Path]) -> list[bool]:
+        """Check whether each of many paths exists.
+
+        Gives the same answers as calling ``exists()`` per path. Paths are
+        grouped by parent directory and each parent is listed once, so checks
+        clustered in a few directories cost one directory read per directory
+        instead of one stat per path. Listed symlinks are followed, and names
+        the listing doesn't contain verbatim (e.g. a different case on a
+        case-insensitive filesystem) fall back to a stat.
+
+        Args:
+            paths: Paths to check.
+
+        Returns:
+            One bool per path, in the same order as ``paths``.
+        """
+        entries_by_parent: dict[Path, dict[str, os.DirEntry[str]]] = {}
+        for path in paths:
+            if path.parent not in entries_by_parent:
+                try:
+                    with os.scandir(path.parent) as entries:
+                        entries_by_parent[path.parent] = {entry.name: entry for entry in entries}
+                except OSError:
+                    # Missing or unreadable parent: let the fallback decide
+                    entries_by_parent[path.parent] = {}
+
+        results: list[bool] = []
+        for path in paths:
+            entry = entries_by_parent[path.parent].get(path.name)
+            if entry is None:
+                results.append(os.path.exists(path))
+            elif entry.is_symlink():
+                # A dangling link is listed but does not exist
+                results.append(os.path.exists(entry))
+            else:
+                results.append(True)
+        return results
+
     def append_text(self, path: Path, content: str) -> None:
         """Append text content to a file.
 
@@ -118,15 +254,15 @@ class FileSystemAdapter:
 
         Returns:
             Sorted list of absolute paths to all files (not directories).
-            Hidden files (starting with '.') are excluded.
+            Hidden files (starting with '.') are excluded, and hidden
+            directories are not descended into. Symlinked directories are
+            neither followed nor listed.
         """
-        files: list[Path] = []
-        for item in directory.rglob("*"):
-            # Skip directories
-            if item.is_dir():
-                continue
-            # Skip hidden files
-            if item.name.startswith("."):
-                continue
-            files.append(item)
-        return sorted(files)
+        # walk_entries yields in sorted order already and never follows
+        # symlinked directories; is_dir() here only drops them from the list
+        # (it is answered from the directory read for non-symlink entries).
+        return [
+            Path(entry.path)
+            for entry in walk_entries(directory, skip_hidden_dirs=True)
+            if not entry.is_dir()
+        ]
@@ -3,7 +3,7 @@
 Handles reading and writing .nest/manifest.json files.
 """
 
-import json
+import os
 from pathlib import Path
 
 from pydantic import ValidationError
@@ -13,6 +13,19 @@ from nest.core.exceptions import ManifestError
 from nest.core.models import Manifest
 from nest.core.paths import MANIFEST_FILENAME, NEST_META_DIR
 
+# Parsed manifests keyed by path, validated against (st_mtime_ns, st_size).
+# A stat is far cheaper than re-reading and re-parsing a large manifest.
+_MANIFEST_CACHE: dict[Path, tuple[int, int, Manifest]] = {}
+
+
+def _detached_copy(manifest: Manifest) -> Manifest:
+    """Copy a manifest so callers can mutate it without touching the cache.
+
+    Callers replace or delete ``files`` entries but never mutate a FileEntry
+    in place, so copying the dict is enough.
+    """
+    return manifest.model_copy(update={"files": dict(manifest.files)})
+
 
 class ManifestAdapter:
     """Adapter for manifest file operations.
@@ -29,8 +42,7 @@ class ManifestAdapter:
         Returns:
             True if .nest/manifest.json exists, False otherwise.
         """
-        manifest_path = project_dir / NEST_META_DIR / MANIFEST_FILENAME
-        return manifest_path.exists()
+        return os.path.exists(os.path.join(project_dir, NEST_META_DIR, MANIFEST_FILENAME))
 
     def create(self, project_dir: Path) -> Manifest:
         """Create a new manifest file with initial values.
@@ -63,30 +75,37 @@ class ManifestAdapter:
             ManifestError: If manifest file is invalid JSON or has invalid structure.
         """
         manifest_path = project_dir / NEST_META_DIR / MANIFEST_FILENAME
-        if not manifest_path.exists():
-            raise FileNotFoundError(f"Manifest not found: {manifest_path}")
-
-        content = manifest_path.read_text(encoding="utf-8")
-
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            raise ManifestError(
-                f"Manifest file is corrupt (invalid JSON). "
-                f"Run `nest doctor` to repair. Details: {e}"
-            ) from e
+            st = manifest_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Manifest not found: {manifest_path}") from None
+
+        cached = _MANIFEST_CACHE.get(manifest_path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return _detached_copy(cached[2])
 
         try:
-            return Manifest.model_validate(data)
+            manifest = Manifest.model_validate_json(manifest_path.read_bytes())
         except ValidationError as e:
+            if any(err["type"] == "json_invalid" for err in e.errors()):
+                raise ManifestError(
+                    f"Manifest file is corrupt (invalid JSON). "
+                    f"Run `nest doctor` to repair. Details: {e}"
+                ) from e
             raise ManifestError(
                 f"Manifest file is corrupt (invalid structure). "
                 f"Run `nest doctor` to repair. Details: {e}"
             ) from e
 
+        _MANIFEST_CACHE[manifest_path] = (st.st_mtime_ns, st.st_size, _detached_copy(manifest))
+        return manifest
+
     def save(self, project_dir: Path, manifest: Manifest) -> None:
         """Save manifest to file.
 
+        The manifest is written to a sibling temp file and moved into place,
+        so a crash mid-write never leaves a truncated manifest behind.
+
         Args:
             project_dir: Path to the project root directory.
             manifest: The Manifest instance to save.
@@ -94,5 +113,14 @@ class ManifestAdapter:
         meta_dir = project_dir / NEST_META_DIR
         meta_dir.mkdir(parents=True, exist_ok=True)
         manifest_path = meta_dir / MANIFEST_FILENAME
-        json_str = manifest.model_dump_json(indent=2)
-        manifest_path.write_text(json_str, encoding="utf-8", newline="\n")
+        tmp_path = manifest_path.with_name(f"{MANIFEST_FILENAME}.tmp")
+        # The model's prebuilt core serializer emits UTF-8 bytes directly,
+        # skipping model_dump_json's bytes -> str -> bytes round trip. Unset
+        # optional fields are left out; they load back as their None default.
+        tmp_path.write_bytes(
+            Manifest.__pydantic_serializer__.to_json(manifest, indent=2, exclude_none=True)
+        )
+        os.replace(tmp_path, manifest_path)
+
+        st = manifest_path.stat()
+        _MANIFEST_CACHE[manifest_path] = (st.st_mtime_ns, st.st_size, _detached_copy(manifest))
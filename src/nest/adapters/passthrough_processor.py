@@ -4,9 +4,9 @@ Copies text files without conversion, preserving original content and extension.
 Implements DocumentProcessorProtocol for seamless integration with the sync pipeline.
 """
 
-import shutil
 from pathlib import Path
 
+from nest.adapters.filesystem import copy_file
 from nest.core.models import ProcessingResult
 
 
@@ -32,7 +32,7 @@ class PassthroughProcessor:
         """
         try:
             output.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, output)
+            copy_file(source, output)
             return ProcessingResult(
                 source_path=source,
                 status="success",
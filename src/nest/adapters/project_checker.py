@@ -1,5 +1,6 @@
 """Project state checker adapter."""
 
+import os
 from pathlib import Path
 
 from nest.adapters.manifest import ManifestAdapter
@@ -17,7 +18,9 @@ _LEGACY_MANIFEST = ".nest_manifest.json"
 class ProjectChecker:
     """Adapter for project state validation.
 
-    Implements ProjectCheckerProtocol.
+    Implements ProjectCheckerProtocol. The fixed-name probes go straight to
+    ``os.path`` rather than building a ``Path`` per check, since doctor runs
+    them on every invocation.
     """
 
     def __init__(self) -> None:
@@ -58,8 +61,7 @@ class ProjectChecker:
         Returns:
             True if all agent files exist, False otherwise.
         """
-        agent_dir = project_dir / AGENT_DIR
-        return all((agent_dir / f).exists() for f in AGENT_FILES)
+        return not self.missing_agent_files(project_dir)
 
     def missing_agent_files(self, project_dir: Path) -> list[str]:
         """Return list of missing agent filenames.
@@ -70,8 +72,13 @@ class ProjectChecker:
         Returns:
             List of agent filenames that are missing. Empty list if all present.
         """
-        agent_dir = project_dir / AGENT_DIR
-        return [f for f in AGENT_FILES if not (agent_dir / f).exists()]
+        # One directory read covers every agent file instead of a stat each
+        try:
+            with os.scandir(project_dir / AGENT_DIR) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            present = set()
+        return [f for f in AGENT_FILES if f not in present]
 
     def source_folder_exists(self, project_dir: Path) -> bool:
         """Check if source folder exists.
@@ -82,7 +89,7 @@ class ProjectChecker:
         Returns:
             True if _nest_sources/ directory exists, False otherwise.
         """
-        return (project_dir / SOURCE_FOLDER).is_dir()
+        return os.path.isdir(os.path.join(project_dir, SOURCE_FOLDER))
 
     def context_folder_exists(self, project_dir: Path) -> bool:
         """Check if context folder exists.
@@ -93,7 +100,7 @@ class ProjectChecker:
         Returns:
             True if _nest_context/ directory exists, False otherwise.
         """
-        return (project_dir / CONTEXT_FOLDER).is_dir()
+        return os.path.isdir(os.path.join(project_dir, CONTEXT_FOLDER))
 
     def meta_folder_exists(self, project_dir: Path) -> bool:
         """Check if .nest/ metadata directory exists.
@@ -104,7 +111,40 @@ class ProjectChecker:
         Returns:
             True if .nest/ directory exists, False otherwise.
         """
-        return (project_dir / NEST_META_DIR).is_dir()
+        return os.path.isdir(os.path.join(project_dir, NEST_META_DIR))
+
+    def has_project_markers(self, project_dir: Path) -> bool:
+        """Check whether any Nest project marker is present.
+
+        The manifest is checked first, since a real project almost always
+        has one. Only when it is missing is ``project_dir`` read once for the
+        remaining markers, looking inside ``.github/`` only when the listing
+        shows it, so a directory that is not a Nest project costs one probe
+        and a single directory read instead of one probe per marker.
+
+        Args:
+            project_dir: Path to the directory to check.
+
+        Returns:
+            True if a manifest (current or legacy layout), all agent files,
+            or either project folder exists, False otherwise.
+        """
+        if self.manifest_exists(project_dir):
+            return True
+
+        try:
+            with os.scandir(project_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except OSError:
+            return False
+
+        if _LEGACY_MANIFEST in entries:
+            return True
+        for folder in (SOURCE_FOLDER, CONTEXT_FOLDER):
+            entry = entries.get(folder)
+            if entry is not None and entry.is_dir():
+                return True
+        return AGENT_DIR.parts[0] in entries and self.agent_file_exists(project_dir)
 
     def has_legacy_layout(self, project_dir: Path) -> bool:
         """Check if project uses the legacy metadata layout.
@@ -117,4 +157,4 @@ class ProjectChecker:
         Returns:
             True if legacy layout detected, False otherwise.
         """
-        return (project_dir / _LEGACY_MANIFEST).exists()
+        return os.path.exists(os.path.join(project_dir, _LEGACY_MANIFEST))
@@ -5,6 +5,7 @@ Services depend on these protocols, not concrete implementations.
 """
 
 import subprocess
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import Literal, Protocol, runtime_checkable
 
@@ -21,6 +22,13 @@ class DocumentProcessorProtocol(Protocol):
     Note:
         Output Markdown should exclude base64-encoded images to keep
         content token-efficient for LLM context usage.
+
+    Concurrency:
+        Docling conversion is CPU-bound and holds the GIL for much of its
+        pipeline, so threads do not speed it up; parallelize across
+        processes via BatchDocumentProcessorProtocol instead. Cheap
+        I/O-bound processors (e.g. passthrough copies) are simply called
+        in sequence.
     """
 
     def process(self, source: Path, output: Path) -> ProcessingResult:
@@ -41,11 +49,55 @@ class DocumentProcessorProtocol(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchDocumentProcessorProtocol(Protocol):
+    """Protocol for processors that can convert many documents at once.
+
+    Optional capability on top of DocumentProcessorProtocol. Services check
+    for it with ``isinstance`` and fall back to per-file ``process()`` calls
+    for processors that don't implement it.
+
+    Concurrency:
+        Implementations own their parallelism (a ProcessPoolExecutor for
+        CPU-bound converters); callers must not wrap ``process_batch`` in
+        another pool.
+    """
+
+    def process_batch(
+        self,
+        jobs: Sequence[tuple[Path, Path]],
+        max_workers: int | None = None,
+    ) -> Iterator[ProcessingResult]:
+        """Convert many documents to Markdown, possibly in parallel.
+
+        Args:
+            jobs: ``(source, output)`` pairs, as passed to ``process()``.
+            max_workers: Maximum number of parallel workers (None for default).
+
+        Yields:
+            One ProcessingResult per job, in the same order as ``jobs``.
+
+        Note:
+            Individual file failures should NOT raise exceptions.
+            Instead, yield a ProcessingResult with status="failed".
+
+            Implementations should keep up to ``max_workers`` jobs in flight
+            at all times (e.g. submit every job to one executor) rather than
+            splitting ``jobs`` into fixed-size rounds, so a slow file never
+            leaves the other workers idle while a round drains.
+        """
+        ...
+
+
 @runtime_checkable
 class ManifestProtocol(Protocol):
     """Protocol for manifest file operations.
 
     Implementations handle reading, writing, and checking manifest files.
+
+    Concurrency:
+        Not safe for concurrent use. Load and save from a single thread;
+        sync buffers entries and saves once at the end.
     """
 
     def exists(self, project_dir: Path) -> bool:
@@ -100,6 +152,10 @@ class FileSystemProtocol(Protocol):
     """Protocol for filesystem operations.
 
     Implementations handle directory and file operations.
+
+    Concurrency:
+        I/O-bound. Calls on distinct paths may run in threads; there is
+        no benefit to process pools here.
     """
 
     def create_directory(self, path: Path) -> None:
@@ -111,7 +167,7 @@ class FileSystemProtocol(Protocol):
         ...
 
     def write_text(self, path: Path, content: str) -> None:
-        """Write text content to a file.
+        """Write text content to a file, creating parent directories as needed.
 
         Args:
             path: Path to the file to write.
@@ -144,6 +200,23 @@ class FileSystemProtocol(Protocol):
         """
         ...
 
+    def exists_many(self, paths: Sequence[Path]) -> list[bool]:
+        """Check whether each of many paths exists.
+
+        Args:
+            paths: Paths to check.
+
+        Returns:
+            One bool per path, in the same order as ``paths``; each matches
+            what ``exists()`` returns for that path.
+
+        Note:
+            Implementations should read each distinct parent directory once
+            rather than stat'ing every path, since bulk checks are typically
+            clustered in a few directories.
+        """
+        ...
+
     def append_text(self, path: Path, content: str) -> None:
         """Append text content to a file.
 
@@ -215,11 +288,19 @@ class FileSystemProtocol(Protocol):
 
         Returns:
             Sorted list of absolute paths to all files (not directories).
-            Hidden files (starting with '.') are excluded.
+            Hidden files (starting with '.') are excluded, and hidden
+            directories are not recursed into.
             Results are sorted for deterministic behavior.
 
         Note:
             Used for scanning processed_context/ to detect orphan files.
+            Implementations should walk with ``os.scandir`` (or an equivalent
+            that reports entry types from the directory read) rather than
+            stat'ing every entry to tell files from directories. Hidden
+            directories must be pruned before descending, not filtered out
+            per file afterwards, so trees like ``.git/`` are never read.
+            Symlinked directories must not be followed (nor listed), so a
+            symlink cycle can never make the walk recurse without bound.
         """
         ...
 
@@ -334,6 +415,14 @@ class FileDiscoveryProtocol(Protocol):
             Sorted list of absolute paths to discovered files.
             Sorting ensures deterministic ordering.
 
+        Note:
+            Implementations should walk with ``os.scandir`` (or an equivalent
+            that reports entry types from the directory read) and prune hidden
+            directories before descending, so discovery costs one directory
+            read per folder rather than a stat per entry. Symlinked
+            directories must not be followed, so symlink cycles cannot make
+            the walk recurse without bound; symlinked files are returned.
+
         Example:
             >>> adapter = FileDiscoveryAdapter()
             >>> files = adapter.discover(
@@ -474,6 +563,18 @@ class ProjectCheckerProtocol(Protocol):
         """
         ...
 
+    def has_project_markers(self, project_dir: Path) -> bool:
+        """Check whether any Nest project marker is present.
+
+        Args:
+            project_dir: Path to the directory to check.
+
+        Returns:
+            True if a manifest (current or legacy layout), all agent files,
+            or either project folder exists, False otherwise.
+        """
+        ...
+
     def has_legacy_layout(self, project_dir: Path) -> bool:
         """Check if project uses the legacy metadata layout.
 
@@ -583,6 +684,9 @@ class LLMProviderProtocol(Protocol):
 
     Implementations handle sending chat completion requests to LLM APIs.
     Used by AI enrichment and glossary services.
+
+    Concurrency:
+        Network-bound; calls may be issued from a ThreadPoolExecutor.
     """
 
     def complete(
@@ -616,6 +720,10 @@ class VisionLLMProviderProtocol(Protocol):
     requests to vision-capable LLM APIs.
     Kept separate from LLMProviderProtocol to allow the vision adapter
     to be None independently of the text adapter.
+
+    Concurrency:
+        Network-bound; picture descriptions are fanned out over a
+        ThreadPoolExecutor.
     """
 
     @property
@@ -1,15 +1,34 @@
 """VS Code Custom Agent file generator."""
 
+import functools
+from importlib.resources import files
 from pathlib import Path
 
-from jinja2 import Environment, PackageLoader, select_autoescape
-
 from nest.adapters.protocols import FileSystemProtocol
 from nest.core.paths import TEMPLATE_TO_AGENT_FILE
 
 
+@functools.cache
+def _load_template(name: str) -> str:
+    """Read a packaged agent template.
+
+    The templates are static Markdown with no placeholders, so they are
+    returned as-is rather than run through a template engine. Cached per
+    process.
+
+    Args:
+        name: Template filename under ``nest/agents/templates``.
+
+    Returns:
+        Template content, without a single trailing newline (matching the
+        Jinja2 rendering these files were written for).
+    """
+    text = files("nest.agents").joinpath("templates", name).read_text(encoding="utf-8")
+    return text.removesuffix("\n")
+
+
 class VSCodeAgentWriter:
-    """Generates VS Code Custom Agent files from Jinja2 templates."""
+    """Generates VS Code Custom Agent files from packaged templates."""
 
     def __init__(self, filesystem: FileSystemProtocol):
         """Initialize writer with filesystem adapter.
@@ -18,10 +37,6 @@ class VSCodeAgentWriter:
             filesystem: Filesystem adapter for directory/file operations.
         """
         self._filesystem = filesystem
-        self._jinja_env = Environment(
-            loader=PackageLoader("nest.agents", "templates"),
-            autoescape=select_autoescape(),
-        )
 
     def render(self) -> str:
         """Render coordinator agent template to string without writing to disk.
@@ -29,8 +44,7 @@ class VSCodeAgentWriter:
         Returns:
             Rendered coordinator template content as string.
         """
-        template = self._jinja_env.get_template("coordinator.md.jinja")
-        return template.render()
+        return _load_template("coordinator.md.jinja")
 
     def generate(self, output_path: Path) -> None:
         """Generate coordinator VS Code agent file.
@@ -42,13 +56,8 @@ class VSCodeAgentWriter:
         Raises:
             IOError: If directory cannot be created or file cannot be written.
         """
-        # Ensure parent directory exists
-        output_dir = output_path.parent
-        if not self._filesystem.exists(output_dir):
-            self._filesystem.create_directory(output_dir)
-
-        content = self.render()
-        self._filesystem.write_text(output_path, content)
+        # write_text creates the parent directory on demand
+        self._filesystem.write_text(output_path, self.render())
 
     def render_all(self) -> dict[str, str]:
         """Render all agent templates to strings without writing to disk.
@@ -58,8 +67,7 @@ class VSCodeAgentWriter:
         """
         result: dict[str, str] = {}
         for template_name, agent_filename in TEMPLATE_TO_AGENT_FILE.items():
-            template = self._jinja_env.get_template(template_name)
-            result[agent_filename] = template.render()
+            result[agent_filename] = _load_template(template_name)
         return result
 
     def generate_all(self, output_dir: Path) -> None:
@@ -71,7 +79,5 @@ class VSCodeAgentWriter:
         Raises:
             IOError: If directory cannot be created or files cannot be written.
         """
-        if not self._filesystem.exists(output_dir):
-            self._filesystem.create_directory(output_dir)
         for filename, content in self.render_all().items():
             self._filesystem.write_text(output_dir / filename, content)
@@ -0,0 +1,22 @@
+"""Helpers shared by CLI commands."""
+
+import os
+from pathlib import Path
+
+
+def resolve_project_root(target_dir: Path | None) -> Path:
+    """Resolve the project root for a CLI command.
+
+    An explicit ``--dir`` is canonicalized. The default, the current working
+    directory, is used as-is: ``os.getcwd()`` is already absolute and
+    symlink-free, so resolving it would only repeat per-component lookups.
+
+    Args:
+        target_dir: Directory passed on the command line, or None for cwd.
+
+    Returns:
+        Absolute project root path.
+    """
+    if target_dir is None:
+        return Path(os.getcwd())
+    return target_dir.resolve()
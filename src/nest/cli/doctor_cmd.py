@@ -30,6 +30,19 @@ from nest.ui.doctor_display import (
 )
 from nest.ui.messages import get_console
 
+_MANIFEST_STATUS_LABELS = {
+    "missing": "Manifest missing",
+    "invalid_json": "Manifest has invalid JSON",
+    "invalid_structure": "Manifest has invalid structure",
+    "version_mismatch": "Manifest version mismatch",
+}
+
+_FOLDER_STATUS_LABELS = {
+    "sources_missing": "_nest_sources/ folder missing",
+    "context_missing": "_nest_context/ folder missing",
+    "both_missing": "Project folders missing",
+}
+
 
 def create_doctor_service(project_checker: ProjectChecker) -> DoctorService:
     """Composition root for doctor service.
@@ -76,7 +89,7 @@ def _count_issues(
     issues: list[str] = []
 
     # Environment failures
-    for check in [env_report.python, env_report.uv, env_report.nest]:
+    for check in env_report.checks:
         if check.status == "fail":
             msg = f"{check.name} check failed"
             if check.message:
@@ -91,22 +104,11 @@ def _count_issues(
     if project_report:
         status = project_report.status
         if status.manifest_status != "valid":
-            label_map = {
-                "missing": "Manifest missing",
-                "invalid_json": "Manifest has invalid JSON",
-                "invalid_structure": "Manifest has invalid structure",
-                "version_mismatch": "Manifest version mismatch",
-            }
-            issues.append(label_map.get(status.manifest_status, "Manifest issue"))
+            issues.append(_MANIFEST_STATUS_LABELS.get(status.manifest_status, "Manifest issue"))
         if not status.agent_file_present:
             issues.append("Agent files missing")
         if status.folders_status != "intact":
-            folder_map = {
-                "sources_missing": "_nest_sources/ folder missing",
-                "context_missing": "_nest_context/ folder missing",
-                "both_missing": "Project folders missing",
-            }
-            issues.append(folder_map.get(status.folders_status, "Folders issue"))
+            issues.append(_FOLDER_STATUS_LABELS.get(status.folders_status, "Folders issue"))
         if not status.meta_folder_present:
             issues.append(".nest/ metadata directory missing")
         if status.legacy_layout_detected:
@@ -125,13 +127,8 @@ def _is_nest_project(project_dir: Path, project_checker: ProjectChecker) -> bool
     Returns:
         True if any Nest project markers exist, False otherwise.
     """
-    return (
-        project_checker.manifest_exists(project_dir)
-        or project_checker.has_legacy_layout(project_dir)
-        or project_checker.agent_file_exists(project_dir)
-        or project_checker.source_folder_exists(project_dir)
-        or project_checker.context_folder_exists(project_dir)
-    )
+    # One listing of project_dir answers every marker check
+    return project_checker.has_project_markers(project_dir)
 
 
 def doctor_command(
@@ -151,15 +148,20 @@ def doctor_command(
     project_checker = ProjectChecker()
     service = create_doctor_service(project_checker)
     env_report = service.check_environment()
-    model_report = service.check_ml_models()
 
     # Check if we're in a Nest project
     project_dir = Path.cwd()
-    if _is_nest_project(project_dir, project_checker):
+    in_project = _is_nest_project(project_dir, project_checker)
+    if in_project:
         project_report = service.check_project(project_dir)
     else:
         project_report = None
 
+    # Model cache inspection walks the cache directory; only pay for it
+    # when there is a project to report on or repairs were requested
+    models_checked = in_project or fix
+    model_report = service.check_ml_models() if models_checked else None
+
     # Detect issues
     issues = _count_issues(env_report, model_report, project_report)
 
@@ -205,6 +207,11 @@ def doctor_command(
         # All pass (AC3)
         display_success_message(console)
 
-    # Show hint when outside project
+    # Show one hint when outside project (models are only skipped there)
     if project_report is None:
-        console.print("\n[dim]ℹ Run in a Nest project for full diagnostics[/dim]")
+        if models_checked:
+            console.print("\n[dim]ℹ Run in a Nest project for full diagnostics[/dim]")
+        else:
+            console.print(
+                "\n[dim]ℹ ML models not checked — run in a Nest project for full diagnostics[/dim]"
+            )
@@ -12,6 +12,7 @@ import typer
 from nest.adapters.filesystem import FileSystemAdapter
 from nest.adapters.manifest import ManifestAdapter
 from nest.agents.vscode_writer import VSCodeAgentWriter
+from nest.cli._common import resolve_project_root
 from nest.core.exceptions import ModelError, NestError
 from nest.core.paths import SOURCES_DIR
 from nest.services.init_service import InitService
@@ -78,7 +79,7 @@ def init_command(
         nest init
     """
     console = get_console()
-    resolved_dir = (target_dir or Path.cwd()).resolve()
+    resolved_dir = resolve_project_root(target_dir)
 
     try:
         service = create_init_service()
@@ -1,25 +1,193 @@
 """Main CLI entry point for nest command."""
 
 import logging
+from pathlib import Path
+from typing import Annotated
 
 import typer
 
 from nest.cli.config_cmd import config_app
-from nest.cli.doctor_cmd import doctor_command
-from nest.cli.init_cmd import init_command
-from nest.cli.status_cmd import status_command
-from nest.cli.sync_cmd import sync_command
-from nest.cli.update_cmd import update_command
+from nest.cli.sync_cmd import OnErrorMode
 from nest.ui.logger import install_rich_console_handler
 
 app = typer.Typer()
 
-# Register commands
-app.command(name="init")(init_command)
-app.command(name="sync")(sync_command)
-app.command(name="status")(status_command)
-app.command(name="doctor")(doctor_command)
-app.command(name="update")(update_command)
+# Command modules are imported when their command runs, not at startup: each
+# one pulls in its adapters and services (pydantic models, docling for sync).
+# Typer builds --help from these stubs, so their options and docstrings must
+# be kept in step with the *_command functions they dispatch to.
+
+
+@app.command(name="init")
+def _init(
+    target_dir: Annotated[
+        Path | None,
+        typer.Option("--dir", "-d", help="Target directory for project initialization"),
+    ] = None,
+) -> None:
+    """Initialize a new Nest project.
+
+    Creates the required directory structure and manifest file
+    for processing documents with nest sync.
+
+    Example:
+        nest init
+    """
+    from nest.cli.init_cmd import init_command
+
+    init_command(target_dir=target_dir)
+
+
+@app.command(name="sync")
+def _sync(
+    on_error: Annotated[
+        OnErrorMode,
+        typer.Option(
+            "--on-error",
+            help="Error handling: 'skip' to continue, 'fail' to abort",
+        ),
+    ] = OnErrorMode.SKIP,
+    dry_run: Annotated[
+        bool,
+        typer.Option(
+            "--dry-run",
+            help="Preview what would be processed without making changes",
+        ),
+    ] = False,
+    force: Annotated[
+        bool,
+        typer.Option(
+            "--force",
+            help="Reprocess all files regardless of checksum",
+        ),
+    ] = False,
+    no_clean: Annotated[
+        bool,
+        typer.Option(
+            "--no-clean",
+            help="Detect orphans but don't remove them",
+        ),
+    ] = False,
+    no_ai: Annotated[
+        bool,
+        typer.Option(
+            "--no-ai",
+            help="Skip AI enrichment even when API key is configured",
+        ),
+    ] = False,
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            "-v",
+            help="Show detailed processing logs (Docling, HTTP, etc.)",
+        ),
+    ] = False,
+    target_dir: Annotated[
+        Path | None,
+        typer.Option(
+            "--dir",
+            "-d",
+            help="Target directory for sync operation",
+        ),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            min=1,
+            help="Maximum parallel document conversions (default: up to 4)",
+        ),
+    ] = None,
+) -> None:
+    """Sync documents from sources to context directory.
+
+    Processes PDF, DOCX, PPTX, XLSX, and HTML files from _nest_sources/
+    and converts them to Markdown in _nest_context/.
+
+    Examples:
+        nest sync
+        nest sync --dry-run
+        nest sync --force
+        nest sync --on-error=fail
+        nest sync --workers 2
+    """
+    from nest.cli.sync_cmd import sync_command
+
+    sync_command(
+        on_error=on_error,
+        dry_run=dry_run,
+        force=force,
+        no_clean=no_clean,
+        no_ai=no_ai,
+        verbose=verbose,
+        target_dir=target_dir,
+        workers=workers,
+    )
+
+
+@app.command(name="status")
+def _status(
+    target_dir: Annotated[
+        Path | None,
+        typer.Option("--dir", "-d", help="Target directory for status operation"),
+    ] = None,
+) -> None:
+    """Show project status.
+
+    Examples:
+        nest status
+        nest status --dir /path/to/project
+    """
+    from nest.cli.status_cmd import status_command
+
+    status_command(target_dir=target_dir)
+
+
+@app.command(name="doctor")
+def _doctor(
+    fix: bool = typer.Option(False, "--fix", help="Automatically fix detected issues"),
+) -> None:
+    """Validate development environment and project state.
+
+    Checks Python version, uv installation, Nest version, and optionally
+    project-specific validations if run inside a Nest project.
+
+    Examples:
+        nest doctor
+        nest doctor --fix
+    """
+    from nest.cli.doctor_cmd import doctor_command
+
+    doctor_command(fix=fix)
+
+
+@app.command(name="update")
+def _update(
+    check: Annotated[
+        bool,
+        typer.Option("--check", help="Only check for updates without installing"),
+    ] = False,
+    target_dir: Annotated[
+        Path | None,
+        typer.Option("--dir", "-d", help="Project directory for agent migration check"),
+    ] = None,
+) -> None:
+    """Check for and install Nest updates.
+
+    Queries available versions, displays comparison, and optionally
+    installs a selected version via uv.
+
+    Examples:
+        nest update
+        nest update --check
+        nest update --dir /path/to/project
+    """
+    from nest.cli.update_cmd import update_command
+
+    update_command(check=check, target_dir=target_dir)
+
+
 app.add_typer(config_app, name="config")
 
 
@@ -4,28 +4,36 @@ Handles the `nest status` command.
 """
 
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
-from nest.adapters.filesystem import FileSystemAdapter
-from nest.adapters.manifest import ManifestAdapter
+from nest.cli._common import resolve_project_root
 from nest.core.exceptions import NestError
-from nest.services.status_service import StatusService
 from nest.ui.messages import error, get_console
-from nest.ui.status_display import display_status
 
+if TYPE_CHECKING:
+    from nest.adapters.protocols import ManifestProtocol
+    from nest.services.status_service import StatusService
 
-def create_status_service() -> StatusService:
+
+def create_status_service(manifest: "ManifestProtocol | None" = None) -> "StatusService":
     """Composition root for status service.
 
+    Args:
+        manifest: Manifest adapter already used by the caller, reused so the
+            command wires a single instance. A new ManifestAdapter if omitted.
+
     Returns:
         Configured StatusService with real adapters.
     """
+    from nest.adapters.filesystem import FileSystemAdapter
+    from nest.adapters.manifest import ManifestAdapter
+    from nest.services.status_service import StatusService
 
     return StatusService(
         filesystem=FileSystemAdapter(),
-        manifest=ManifestAdapter(),
+        manifest=manifest if manifest is not None else ManifestAdapter(),
     )
 
 
@@ -42,8 +50,11 @@ def status_command(
         nest status --dir /path/to/project
     """
 
+    from nest.adapters.manifest import ManifestAdapter
+    from nest.ui.status_display import display_status
+
     console = get_console()
-    project_root = (target_dir or Path.cwd()).resolve()
+    project_root = resolve_project_root(target_dir)
 
     # AC4: Outside project
     manifest_adapter = ManifestAdapter()
@@ -52,7 +63,7 @@ def status_command(
         raise typer.Exit(1)
 
     try:
-        service = create_status_service()
+        service = create_status_service(manifest_adapter)
         report = service.get_status(project_root)
         display_status(report, console)
 
@@ -4,19 +4,15 @@ Handles the `nest sync` command with flags for error handling,
 dry-run, force reprocessing, and orphan cleanup control.
 """
 
-import logging
 import os
+from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Annotated, Literal
 
 import typer
 
-from nest.adapters.file_discovery import FileDiscoveryAdapter
-from nest.adapters.filesystem import FileSystemAdapter
-from nest.adapters.manifest import ManifestAdapter
-from nest.adapters.passthrough_processor import PassthroughProcessor
+from nest.cli._common import resolve_project_root
 from nest.core.exceptions import NestError, ProcessingError
-from nest.core.models import DryRunResult, ProcessingResult, SyncResult
 from nest.core.paths import (
     AI_SEEN_MARKER,
     CONTEXT_DIR,
@@ -24,26 +20,35 @@ from nest.core.paths import (
     NEST_META_DIR,
     SOURCES_DIR,
 )
-from nest.services.discovery_service import DiscoveryService
-from nest.services.index_service import IndexService
-from nest.services.manifest_service import ManifestService
-from nest.services.metadata_service import MetadataExtractorService
-from nest.services.orphan_service import OrphanService
-from nest.services.output_service import OutputMirrorService
-from nest.services.sync_service import SyncService
-from nest.ui.logger import setup_error_logger
 from nest.ui.messages import error, get_console, success
-from nest.ui.progress import SyncProgress
 
 if TYPE_CHECKING:
+    import logging
+
     from rich.console import Console
 
+    from nest.core.models import DryRunResult, ProcessingResult, SyncResult
+    from nest.services.sync_service import SyncService
+
+# Adapters, services and progress UI are imported inside create_sync_service()
+# and sync_command(): sync_service pulls in docling_core, which would otherwise
+# load for every `nest` invocation, including `--help` and other commands.
+
+
+class OnErrorMode(str, Enum):
+    """Values accepted by ``--on-error``; Click rejects anything else at parse time."""
+
+    SKIP = "skip"
+    FAIL = "fail"
+
 
 class NoOpProcessor:
     """Fallback processor when docling is missing."""
 
-    def process(self, source: Path, output: Path) -> ProcessingResult:
+    def process(self, source: Path, output: Path) -> "ProcessingResult":
         """Fail all processing."""
+        from nest.core.models import ProcessingResult
+
         return ProcessingResult(
             source_path=source,
             status="failed",
@@ -55,7 +60,8 @@ def create_sync_service(
     project_root: Path,
     error_logger: "logging.Logger | logging.LoggerAdapter[logging.Logger] | None" = None,
     no_ai: bool = False,
-) -> SyncService:
+    max_workers: int | None = None,
+) -> "SyncService":
     """Composition root for sync service.
 
     This is the dependency injection entry point for the sync command.
@@ -84,15 +90,29 @@ def create_sync_service(
         project_root: Root directory of the project.
         error_logger: Logger for writing errors to .nest/errors.log.
         no_ai: If True, skip AI enrichment even when API key is configured.
+        max_workers: Maximum parallel Docling conversion processes. None uses
+            the processor's small default.
 
     Returns:
         Configured SyncService with real adapters.
     """
+    from nest.adapters.file_discovery import FileDiscoveryAdapter
+    from nest.adapters.filesystem import FileSystemAdapter
+    from nest.adapters.manifest import ManifestAdapter
+    from nest.adapters.passthrough_processor import PassthroughProcessor
+    from nest.services.discovery_service import DiscoveryService
+    from nest.services.index_service import IndexService
+    from nest.services.manifest_service import ManifestService
+    from nest.services.metadata_service import MetadataExtractorService
+    from nest.services.orphan_service import OrphanService
+    from nest.services.output_service import OutputMirrorService
+    from nest.services.sync_service import SyncService
+
     # Adapters: External system wrappers
     try:
         from nest.adapters.docling_processor import DoclingProcessor
 
-        processor = DoclingProcessor()
+        processor = DoclingProcessor(max_workers=max_workers)
     except ImportError:
         processor = NoOpProcessor()
 
@@ -177,31 +197,14 @@ def create_sync_service(
     )
 
 
-def _validate_on_error(value: str) -> Literal["skip", "fail"]:
-    """Validate --on-error value.
-
-    Args:
-        value: Value from CLI.
-
-    Returns:
-        Validated literal value.
-
-    Raises:
-        typer.BadParameter: If value is not 'skip' or 'fail'.
-    """
-    if value not in ("skip", "fail"):
-        raise typer.BadParameter("Must be 'skip' or 'fail'")
-    return value  # type: ignore[return-value]
-
-
 def sync_command(
     on_error: Annotated[
-        str,
+        OnErrorMode,
         typer.Option(
             "--on-error",
             help="Error handling: 'skip' to continue, 'fail' to abort",
         ),
-    ] = "skip",
+    ] = OnErrorMode.SKIP,
     dry_run: Annotated[
         bool,
         typer.Option(
@@ -246,6 +249,14 @@ def sync_command(
             help="Target directory for sync operation",
         ),
     ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            min=1,
+            help="Maximum parallel document conversions (default: up to 4)",
+        ),
+    ] = None,
 ) -> None:
     """Sync documents from sources to context directory.
 
@@ -257,6 +268,7 @@ def sync_command(
         nest sync --dry-run
         nest sync --force
         nest sync --on-error=fail
+        nest sync --workers 2
     """
     console = get_console()
 
@@ -267,7 +279,7 @@ def sync_command(
         for name in ("docling", "httpx", "openai", "nest"):
             _logging.getLogger(name).setLevel(_logging.INFO)
 
-    project_root = (target_dir or Path.cwd()).resolve()
+    project_root = resolve_project_root(target_dir)
 
     # AC3: Check for Nest project (manifest must exist)
     manifest_path = project_root / NEST_META_DIR / "manifest.json"
@@ -277,18 +289,26 @@ def sync_command(
         console.print('  Action: Run `nest init "Project Name"` to initialize')
         raise typer.Exit(1)
 
-    # Validate flags
-    validated_on_error = _validate_on_error(on_error)
+    # Compare by value: direct callers may pass the plain string
+    validated_on_error: Literal["skip", "fail"] = (
+        "fail" if OnErrorMode(on_error) == OnErrorMode.FAIL else "skip"
+    )
 
-    # Setup error logger
     error_log_path = project_root / NEST_META_DIR / ERROR_LOG_FILENAME
-    # Ensure .nest/ directory exists for log file
-    error_log_path.parent.mkdir(parents=True, exist_ok=True)
-    # cast is needed because LoggerAdapter generic handling varies by python version
-    error_logger = setup_error_logger(error_log_path, service_name="sync")
+
+    # Dry run is a read-only preview: no error log, no progress bar
+    error_logger = None
+    if not dry_run:
+        from nest.ui.logger import setup_error_logger
+
+        # Ensure .nest/ directory exists for log file
+        error_log_path.parent.mkdir(parents=True, exist_ok=True)
+        error_logger = setup_error_logger(error_log_path, service_name="sync")
 
     try:
-        service = create_sync_service(project_root, error_logger=error_logger, no_ai=no_ai)
+        service = create_sync_service(
+            project_root, error_logger=error_logger, no_ai=no_ai, max_workers=workers
+        )
 
         # 1. Discovery phase
         changes = service.discover(force=force)
@@ -333,8 +353,12 @@ def sync_command(
             else:
                 console.print(f" {message}")
 
-        # Execute sync with progress bar
-        with SyncProgress(console=console, disabled=files_to_process_count == 0) as progress:
+        from nest.ui.progress import SyncProgress
+
+        # Execute sync with progress bar. Piped/CI output gets no live bar:
+        # Rich can't animate it there and would only dump the final frame.
+        show_progress = files_to_process_count > 0 and console.is_terminal
+        with SyncProgress(console=console, disabled=not show_progress) as progress:
             progress.start(total=files_to_process_count)
 
             result = service.sync(
@@ -370,25 +394,29 @@ def sync_command(
         raise typer.Exit(1) from None
 
 
-def _display_dry_run_result(result: DryRunResult, console: "Console") -> None:
+def _display_dry_run_result(result: "DryRunResult", console: "Console") -> None:
     """Display dry-run preview output.
 
     Args:
         result: DryRunResult with counts.
         console: Rich console for output.
     """
-    console.print()
-    console.print("[bold cyan]🔍 Dry Run Preview[/bold cyan]")
-    console.print()
-    console.print(f"  Would process: {result.new_count} new, {result.modified_count} modified")
-    console.print(f"  Would skip:    {result.unchanged_count} unchanged")
-    console.print(f"  Would remove:  {result.orphan_count} orphans")
-    console.print()
-    console.print("[dim]Run without --dry-run to execute.[/dim]")
+    # One print call: a single render and write instead of one per line
+    lines = [
+        "",
+        "[bold cyan]🔍 Dry Run Preview[/bold cyan]",
+        "",
+        f"  Would process: {result.new_count} new, {result.modified_count} modified",
+        f"  Would skip:    {result.unchanged_count} unchanged",
+        f"  Would remove:  {result.orphan_count} orphans",
+        "",
+        "[dim]Run without --dry-run to execute.[/dim]",
+    ]
+    console.print("\n".join(lines))
 
 
 def _display_sync_summary(
-    result: SyncResult,
+    result: "SyncResult",
     console: "Console",
     error_log_path: Path,
     ai_detected_key: str = "",
@@ -416,36 +444,38 @@ def _display_sync_summary(
         project_root: Project root directory for marker file operations.
     """
     success("Sync complete")
-    console.print()
 
-    # Show processing counts
-    console.print(f"  Processed: {result.processed_count} files")
-    console.print(f"  Skipped:   {result.skipped_count} unchanged")
+    # Summary lines are collected and printed in one call at the end
+    lines = [
+        "",
+        f"  Processed: {result.processed_count} files",
+        f"  Skipped:   {result.skipped_count} unchanged",
+    ]
 
     # Show failed count with error log reference
     if result.failed_count > 0:
         log_relative = f"{NEST_META_DIR}/{ERROR_LOG_FILENAME}"
-        console.print(f"  Failed:    {result.failed_count} (see {log_relative})")
+        lines.append(f"  Failed:    {result.failed_count} (see {log_relative})")
     else:
-        console.print(f"  Failed:    {result.failed_count}")
+        lines.append(f"  Failed:    {result.failed_count}")
 
     # Show orphan info
     if result.orphans_removed > 0:
-        console.print(f"  Orphans:   {result.orphans_removed} removed")
+        lines.append(f"  Orphans:   {result.orphans_removed} removed")
     elif result.skipped_orphan_cleanup and result.orphans_detected > 0:
-        console.print(f"  Orphans:   {result.orphans_detected} detected (not removed)")
+        lines.append(f"  Orphans:   {result.orphans_detected} detected (not removed)")
     else:
-        console.print(f"  Orphans:   {result.orphans_detected} detected")
+        lines.append(f"  Orphans:   {result.orphans_detected} detected")
 
     # Show user-curated file count
     if result.user_curated_count > 0:
-        console.print(f"  User-curated: {result.user_curated_count} preserved")
+        lines.append(f"  User-curated: {result.user_curated_count} preserved")
 
-    console.print()
-    console.print("  Index updated: .nest/00_MASTER_INDEX.md")
+    lines.append("")
+    lines.append("  Index updated: .nest/00_MASTER_INDEX.md")
 
     if ai_status_note:
-        console.print(f"  AI:          {ai_status_note}")
+        lines.append(f"  AI:          {ai_status_note}")
 
     # Aggregated AI token display
     total_prompt = (
@@ -459,26 +489,26 @@ def _display_sync_summary(
     total_tokens = total_prompt + total_completion
 
     if total_tokens > 0:
-        console.print(
+        lines.append(
             f"  AI tokens:    {total_tokens:,} "
             f"(prompt: {total_prompt:,}, completion: {total_completion:,})"
         )
 
     # Show AI activity counts (enrichment + glossary) on separate detail lines
     if result.ai_files_enriched > 0:
-        console.print(f"  AI enriched:  {result.ai_files_enriched} descriptions")
+        lines.append(f"  AI enriched:  {result.ai_files_enriched} descriptions")
 
     if result.ai_glossary_terms_added > 0:
-        console.print(f"  AI glossary:  {result.ai_glossary_terms_added} terms defined")
+        lines.append(f"  AI glossary:  {result.ai_glossary_terms_added} terms defined")
 
     # Show image description counts
     if result.images_described > 0:
         mermaid_note = (
             f" ({result.images_mermaid} as Mermaid diagrams)" if result.images_mermaid > 0 else ""
         )
-        console.print(f"  Images described: {result.images_described}{mermaid_note}")
+        lines.append(f"  Images described: {result.images_described}{mermaid_note}")
     if result.images_skipped > 0:
-        console.print(f"  Images skipped:  {result.images_skipped} (logos/signatures)")
+        lines.append(f"  Images skipped:  {result.images_skipped} (logos/signatures)")
 
     # First-run AI discovery message
     ai_was_used = (
@@ -492,8 +522,11 @@ def _display_sync_summary(
     if ai_was_used and ai_detected_key and project_root is not None:
         ai_marker = project_root / NEST_META_DIR / AI_SEEN_MARKER
         if not ai_marker.exists():
-            console.print()
-            console.print(f"  🤖 AI enrichment enabled (found {ai_detected_key})")
-            console.print("  💡 Run 'nest config ai' to change AI settings. Use --no-ai to skip.")
+            lines.append("")
+            lines.append(f"  🤖 AI enrichment enabled (found {ai_detected_key})")
+            lines.append("  💡 Run 'nest config ai' to change AI settings. Use --no-ai to skip.")
             # Create marker file
             ai_marker.touch()
+
+    # The summary carries no markup, so skip Rich's markup parser
+    console.out("\n".join(lines))
@@ -46,14 +46,24 @@ class FileChangeDetector:
             raise ValueError(f"Path must be relative, got: {path}")
 
         # Normalize path to use forward slashes consistently
-        path_key = path.as_posix()
+        return self.classify_key(path.as_posix(), checksum)
 
-        # Check if file exists in manifest
-        if path_key not in self._manifest_files:
+    def classify_key(self, path_key: str, checksum: str) -> FileStatus:
+        """Classify a file by its manifest key rather than its Path.
+
+        Args:
+            path_key: Forward-slash relative path, as stored in the manifest.
+            checksum: Current SHA-256 checksum of the file.
+
+        Returns:
+            FileStatus, with the same meaning as for :meth:`classify`.
+        """
+        # One dict probe: a miss means the file is not in the manifest
+        manifest_checksum = self._manifest_files.get(path_key)
+        if manifest_checksum is None:
             return "new"
 
         # Compare checksums
-        manifest_checksum = self._manifest_files[path_key]
         if checksum != manifest_checksum:
             return "modified"
 
@@ -46,6 +46,8 @@ class FileEntry(BaseModel):
         output: Relative path to the output Markdown file.
         status: Processing status (success/failed/skipped).
         error: Error message if processing failed (optional).
+        mtime_ns: Source modification time when sha256 was computed (optional).
+        size: Source size in bytes when sha256 was computed (optional).
     """
 
     sha256: str
@@ -53,6 +55,8 @@ class FileEntry(BaseModel):
     output: str
     status: Literal["success", "failed", "skipped"]
     error: str | None = None
+    mtime_ns: int | None = None
+    size: int | None = None
 
 
 class Manifest(BaseModel):
@@ -79,6 +83,8 @@ class DiscoveredFile(BaseModel):
         status: Change status compared to manifest (new/modified/unchanged).
         checksum: SHA-256 hash of the file content.
         collision_reason: If set, reason this file was skipped due to output path collision.
+        mtime_ns: Modification time observed when the file was checksummed.
+        size: Size in bytes observed when the file was checksummed.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -87,6 +93,8 @@ class DiscoveredFile(BaseModel):
     status: FileStatus
     checksum: str
     collision_reason: str | None = None
+    mtime_ns: int | None = None
+    size: int | None = None
 
 
 class DiscoveryResult(BaseModel):
@@ -5,6 +5,8 @@ Detects orphaned output files that no longer have corresponding source files.
 
 from pathlib import Path
 
+from nest.core.paths import relative_to_project
+
 
 class OrphanDetector:
     """Detects orphaned output files with no corresponding source."""
@@ -32,22 +34,18 @@ class OrphanDetector:
             List of orphan file paths (absolute) to remove.
         """
         # Build reverse lookup: output_path -> source_path
-        output_to_source: dict[str, Path] = {}
-        for source_path, output_relative in manifest_sources.items():
-            output_to_source[output_relative] = source_path
+        output_to_source: dict[str, Path] = {
+            output_relative: source_path
+            for source_path, output_relative in manifest_sources.items()
+        }
 
         orphans: list[Path] = []
 
         for file_path in output_files:
-            relative = file_path.relative_to(output_dir).as_posix()
-
-            # Check if file is in manifest
-            if relative in output_to_source:
-                # File is in manifest - check if source exists
-                source_path = output_to_source[relative]
-                if not source_path.exists():
-                    # Source is missing - this is an orphan
-                    orphans.append(file_path)
-            # else: File NOT in manifest = user-curated, not an orphan
+            # One probe: files NOT in the manifest are user-curated, not orphans
+            source_path = output_to_source.get(relative_to_project(file_path, output_dir))
+            if source_path is not None and not source_path.exists():
+                # Generated by Nest but its source is missing - an orphan
+                orphans.append(file_path)
 
         return orphans
@@ -4,6 +4,7 @@ These functions handle path manipulation for mirroring source file
 structure in output directories. No I/O operations - fully testable.
 """
 
+import os
 from pathlib import Path
 
 # Folder name constants
@@ -125,14 +126,46 @@ def mirror_path(
     Raises:
         ValueError: If source is not under source_root.
     """
-    # Get path relative to source root
-    relative = source.relative_to(source_root)
+    # Called once per source file, so work on the strings directly: a prefix
+    # check, splitext and one join instead of relative_to/with_suffix/"/",
+    # each of which re-parses the path.
+    source_str = os.fspath(source)
+    root_str = os.fspath(source_root)
+    prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+    if len(source_str) > len(prefix) and source_str.startswith(prefix):
+        relative = source_str[len(prefix) :]
+        name = relative.rpartition(os.sep)[2]
+        # splitext and Path.suffix disagree on leading and trailing dots
+        # ("..a", "file."), so only names without either are split here
+        if not (name.startswith(".") or name.endswith(".")):
+            stem, _ = os.path.splitext(relative)
+            return Path(os.path.join(os.fspath(target_root), stem + new_suffix))
+
+    # Not a plain string prefix (e.g. case differs on Windows) or an edge-case
+    # name: let pathlib decide, which also raises ValueError when source is
+    # outside source_root.
+    return target_root / source.relative_to(source_root).with_suffix(new_suffix)
+
+
+def _relative_posix(path: Path, root: Path) -> str:
+    """Return path relative to root as a forward-slash string.
+
+    Same result as ``path.relative_to(root).as_posix()``, but the common case
+    is a string prefix check and one slice rather than building a new Path.
 
-    # Change suffix
-    output_relative = relative.with_suffix(new_suffix)
+    Raises:
+        ValueError: If path is not under root.
+    """
+    path_str = os.fspath(path)
+    root_str = os.fspath(root)
+    prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+    if len(path_str) > len(prefix) and path_str.startswith(prefix):
+        relative = path_str[len(prefix) :]
+        return relative if os.sep == "/" else relative.replace(os.sep, "/")
 
-    # Join with target root
-    return target_root / output_relative
+    # Not a plain string prefix (e.g. case differs on Windows, or path is
+    # root itself): let pathlib decide, raising ValueError if outside root.
+    return path.relative_to(root).as_posix()
 
 
 def relative_to_project(path: Path, project_root: Path) -> str:
@@ -157,9 +190,8 @@ def relative_to_project(path: Path, project_root: Path) -> str:
 
         Result: "processed_context/contracts/alpha.md"
     """
-    relative = path.relative_to(project_root)
     # Use forward slashes for cross-platform manifest portability
-    return relative.as_posix()
+    return _relative_posix(path, project_root)
 
 
 def source_path_to_manifest_key(source: Path, raw_inbox: Path) -> str:
@@ -185,5 +217,4 @@ def source_path_to_manifest_key(source: Path, raw_inbox: Path) -> str:
 
         Result: "contracts/2024/alpha.pdf"
     """
-    relative = source.relative_to(raw_inbox)
-    return relative.as_posix()
+    return _relative_posix(source, raw_inbox)
@@ -137,8 +137,7 @@ class AgentMigrationService:
         files_created: list[str] = []
 
         try:
-            if not self._filesystem.exists(agent_dir):
-                self._filesystem.create_directory(agent_dir)
+            self._filesystem.create_directory(agent_dir)
 
             for filename, expected_content in rendered.items():
                 local_path = agent_dir / filename
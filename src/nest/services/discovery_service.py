@@ -4,13 +4,20 @@ This module provides the DiscoveryService which orchestrates file discovery
 and change detection against the manifest.
 """
 
+import os
+import time
 from pathlib import Path
 
 from nest.adapters.protocols import FileDiscoveryProtocol, ManifestProtocol
 from nest.core.change_detector import FileChangeDetector
-from nest.core.checksum import compute_sha256
+from nest.core.checksum import compute_sha256_many
 from nest.core.models import DiscoveredFile, DiscoveryResult
-from nest.core.paths import ALL_SOURCE_EXTENSIONS, SOURCES_DIR
+from nest.core.paths import ALL_SOURCE_EXTENSIONS, SOURCES_DIR, source_path_to_manifest_key
+
+# A file modified this close to discovery may change again within the same
+# mtime tick after it is hashed, so its stat is not trusted (git's "racily
+# clean" rule). Two seconds also covers filesystems with coarse timestamps.
+_RACY_MARGIN_NS = 2_000_000_000
 
 
 class DiscoveryService:
@@ -38,7 +45,10 @@ class DiscoveryService:
         """Discover files in sources directory and classify by change status.
 
         Discovers both Docling-convertible files and passthrough text files
-        using ALL_SOURCE_EXTENSIONS.
+        using ALL_SOURCE_EXTENSIONS. Files whose size and modification time
+        match their manifest entry are classified as unchanged without
+        being re-hashed. Files modified within two seconds of discovery are
+        always hashed and carry no stat, so it is never cached for them.
 
         Args:
             project_dir: Path to the project root directory.
@@ -67,39 +77,71 @@ class DiscoveryService:
         sources_dir = project_dir / SOURCES_DIR
         discovered_paths = self._file_discovery.discover(sources_dir, set(ALL_SOURCE_EXTENSIONS))
 
+        # Stat each file; one whose size and mtime still match its manifest
+        # entry is unchanged and keeps the recorded checksum without a read.
+        # Force mode reprocesses everything, so it always hashes.
+        racy_cutoff_ns = time.time_ns() - _RACY_MARGIN_NS
+        stats: dict[Path, os.stat_result] = {}
+        path_keys: dict[Path, str] = {}
+        cached_checksums: dict[Path, str] = {}
+        for file_path in discovered_paths:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            stats[file_path] = stat
+            # Keys must be relative to sources_dir to match ManifestService key format
+            path_key = source_path_to_manifest_key(file_path, sources_dir)
+            path_keys[file_path] = path_key
+            entry = manifest_files.get(path_key)
+            if (
+                not force
+                and entry is not None
+                and stat.st_mtime_ns < racy_cutoff_ns
+                and entry.mtime_ns == stat.st_mtime_ns
+                and entry.size == stat.st_size
+            ):
+                cached_checksums[file_path] = entry.sha256
+
+        # Hash the rest on a thread pool; unreadable files
+        # (e.g., locked, deleted race condition) are left out and skipped
+        checksums = compute_sha256_many(
+            file_path for file_path in stats if file_path not in cached_checksums
+        )
+        checksums.update(cached_checksums)
+
         # Classify each discovered file
         result = DiscoveryResult()
 
         for file_path in discovered_paths:
-            # Compute checksum
-            try:
-                checksum = compute_sha256(file_path)
-            except (OSError, PermissionError):
-                # Skip files that cannot be read (e.g., locked, deleted race condition)
+            checksum = checksums.get(file_path)
+            if checksum is None:
                 continue
-
-            # Get relative path for manifest comparison
-            # Keys must be relative to sources_dir to match ManifestService key format
-            relative_path = file_path.relative_to(sources_dir)
+            stat = stats[file_path]
+            path_key = path_keys[file_path]
+            # Only a stat safely older than discovery may be cached
+            stat_is_clean = stat.st_mtime_ns < racy_cutoff_ns
 
             # Classify based on manifest (or force mode)
             if force:
                 # Force mode: treat all files as needing reprocessing
                 # New files stay "new", existing files become "modified"
-                path_key = relative_path.as_posix()
                 if path_key in manifest_checksums:
                     status = "modified"
                 else:
                     status = "new"
             else:
                 # Normal mode: classify based on checksum comparison
-                status = detector.classify(relative_path, checksum)
+                status = detector.classify_key(path_key, checksum)
 
-            # Create discovered file entry
-            discovered = DiscoveredFile(
+            # Create discovered file entry; every value was produced above
+            # with its final type, so skip per-file validation
+            discovered = DiscoveredFile.model_construct(
                 path=file_path,
                 status=status,
                 checksum=checksum,
+                mtime_ns=stat.st_mtime_ns if stat_is_clean else None,
+                size=stat.st_size if stat_is_clean else None,
             )
 
             # Add to appropriate list based on status
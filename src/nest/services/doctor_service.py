@@ -52,10 +52,15 @@ class EnvironmentReport:
     uv: EnvironmentStatus
     nest: EnvironmentStatus
 
+    @property
+    def checks(self) -> tuple[EnvironmentStatus, EnvironmentStatus, EnvironmentStatus]:
+        """Individual checks in display order."""
+        return (self.python, self.uv, self.nest)
+
     @property
     def all_pass(self) -> bool:
         """True if all checks passed (no failures)."""
-        return all(check.status != "fail" for check in [self.python, self.uv, self.nest])
+        return all(check.status != "fail" for check in self.checks)
 
 
 @dataclass
@@ -400,10 +405,10 @@ class DoctorService:
                 manifest_version = None
                 suggestions.append("Run `nest doctor --fix` to rebuild")
 
-        # Check agent file
-        agent_present = self._project_checker.agent_file_exists(project_dir)
+        # Check agent files (one listing answers both "present?" and "which?")
+        missing = self._project_checker.missing_agent_files(project_dir)
+        agent_present = not missing
         if not agent_present:
-            missing = self._project_checker.missing_agent_files(project_dir)
             missing_names = ", ".join(missing)
             suggestions.append(f"Missing agent files: {missing_names}")
 
@@ -498,17 +503,21 @@ class DoctorService:
                 )
 
             source_files = self._filesystem.list_files(sources_dir)
+            rel_paths = [source_path.relative_to(sources_dir) for source_path in source_files]
+            output_rel_paths = [rel_path.with_suffix(".md") for rel_path in rel_paths]
 
-            restored_count = 0
-            for source_path in source_files:
-                rel_path = source_path.relative_to(sources_dir)
-                key = str(rel_path)
-                sha256 = compute_sha256(source_path)
-
-                output_rel_path = rel_path.with_suffix(".md")
-                output_path = context_dir / output_rel_path
+            # One directory read per context folder instead of a stat per output
+            outputs_present = self._filesystem.exists_many(
+                [context_dir / output_rel_path for output_rel_path in output_rel_paths]
+            )
 
-                if self._filesystem.exists(output_path):
+            restored_count = 0
+            for source_path, rel_path, output_rel_path, output_present in zip(
+                source_files, rel_paths, output_rel_paths, outputs_present, strict=True
+            ):
+                if output_present:
+                    key = str(rel_path)
+                    sha256 = compute_sha256(source_path)
                     processed_at = datetime.now(timezone.utc)
 
                     entry = FileEntry(
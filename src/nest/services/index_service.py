@@ -111,10 +111,7 @@ class IndexService:
         Args:
             content: The content to write.
         """
-        # Ensure .nest/ directory exists
-        if not self._fs.exists(self._meta_dir):
-            self._fs.create_directory(self._meta_dir)
-
+        # write_text creates .nest/ on demand
         index_path = self._meta_dir / "00_MASTER_INDEX.md"
         self._fs.write_text(index_path, content)
 
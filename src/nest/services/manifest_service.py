@@ -5,12 +5,13 @@ recording success/failure status for each file.
 """
 
 import logging
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from pathlib import Path
 
 from nest import __version__
 from nest.adapters.protocols import ManifestProtocol
-from nest.core.models import FileEntry, Manifest
+from nest.core.models import DiscoveredFile, FileEntry, Manifest
 from nest.core.paths import source_path_to_manifest_key
 
 logger = logging.getLogger(__name__)
@@ -28,6 +29,7 @@ class ManifestService:
         _raw_inbox: Absolute path to raw_inbox directory.
         _output_dir: Absolute path to processed_context directory.
         _pending_entries: Entries awaiting commit to manifest.
+        _source_stats: Checksum, mtime and size observed per manifest key.
     """
 
     def __init__(
@@ -50,6 +52,24 @@ class ManifestService:
         self._raw_inbox = raw_inbox
         self._output_dir = output_dir
         self._pending_entries: dict[str, FileEntry] = {}
+        self._source_stats: dict[str, tuple[str, int, int]] = {}
+
+    def record_source_stats(self, files: Iterable[DiscoveredFile]) -> None:
+        """Remember the size and mtime each discovered file was hashed at.
+
+        On commit these are stored on every manifest entry whose checksum
+        still matches, so the next discovery can skip re-hashing files
+        whose size and mtime are unchanged. Files discovered without a stat
+        (modified too close to discovery to trust it) are skipped.
+
+        Args:
+            files: Discovered files carrying the stat taken before hashing.
+        """
+        for file in files:
+            if file.mtime_ns is None or file.size is None:
+                continue
+            key = source_path_to_manifest_key(file.path, self._raw_inbox)
+            self._source_stats[key] = (file.checksum, file.mtime_ns, file.size)
 
     def record_success(
         self,
@@ -167,12 +187,22 @@ class ManifestService:
             logger.info("Committing %d entries to manifest.", count)
             manifest.files.update(self._pending_entries)
 
+        # Attach stats only where the entry describes the content that was
+        # hashed, so a file that changed but was never recorded stays dirty
+        for key, (checksum, mtime_ns, size) in self._source_stats.items():
+            entry = manifest.files.get(key)
+            if entry is None or entry.sha256 != checksum:
+                continue
+            if entry.mtime_ns != mtime_ns or entry.size != size:
+                manifest.files[key] = entry.model_copy(update={"mtime_ns": mtime_ns, "size": size})
+
         # Update metadata
         manifest.last_sync = datetime.now(timezone.utc)
         manifest.nest_version = __version__
 
         self._manifest_adapter.save(self._project_root, manifest)
         self._pending_entries.clear()
+        self._source_stats.clear()
         logger.debug("Manifest commit complete.")
 
     def load_current_manifest(self) -> Manifest:
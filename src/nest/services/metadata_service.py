@@ -253,9 +253,5 @@ class MetadataExtractorService:
         )
         content = header + yaml_content
 
-        # Ensure parent directory exists
-        parent = hints_path.parent
-        if not self._fs.exists(parent):
-            self._fs.create_directory(parent)
-
+        # write_text creates the parent directory on demand
         self._fs.write_text(hints_path, content)
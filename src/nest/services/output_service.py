@@ -6,12 +6,20 @@ passthrough text files are copied as-is, Docling-convertible
 files go through document conversion.
 """
 
+import logging
+from collections.abc import Generator, Sequence
 from pathlib import Path
 
-from nest.adapters.protocols import DocumentProcessorProtocol, FileSystemProtocol
+from nest.adapters.protocols import (
+    BatchDocumentProcessorProtocol,
+    DocumentProcessorProtocol,
+    FileSystemProtocol,
+)
 from nest.core.models import ProcessingResult
 from nest.core.paths import is_passthrough_extension, passthrough_mirror_path
 
+logger = logging.getLogger(__name__)
+
 
 class OutputMirrorService:
     """Service for processing files with directory mirroring.
@@ -74,6 +82,65 @@ class OutputMirrorService:
             output_path = self._filesystem.compute_output_path(source, raw_dir, output_dir)
             return self._processor.process(source, output_path)
 
+    def process_files(
+        self,
+        sources: Sequence[Path],
+        raw_dir: Path,
+        output_dir: Path,
+    ) -> Generator[ProcessingResult, None, None]:
+        """Process many files with directory mirroring.
+
+        When every source is Docling-convertible and the processor supports
+        ``process_batch``, the whole batch is handed over at once so it can be
+        converted in parallel. Otherwise each file goes through
+        ``process_file`` one at a time.
+
+        Results are streamed in the same order as ``sources``. Unexpected
+        exceptions for an individual file are logged with their traceback and
+        reported as a failed ProcessingResult, so that one bad file never
+        aborts the batch.
+
+        Args:
+            sources: Paths to source documents.
+            raw_dir: Root of sources directory.
+            output_dir: Root of context directory.
+
+        Yields:
+            One ProcessingResult per source, in input order.
+        """
+        processor = self._processor
+        if isinstance(processor, BatchDocumentProcessorProtocol) and not any(
+            is_passthrough_extension(source.suffix) for source in sources
+        ):
+            jobs: list[tuple[Path, Path]] = []
+            failures: dict[int, ProcessingResult] = {}
+            for index, source in enumerate(sources):
+                try:
+                    output = self._filesystem.compute_output_path(source, raw_dir, output_dir)
+                except Exception as e:
+                    failures[index] = _unexpected_failure(source, e)
+                    continue
+                jobs.append((source, output))
+
+            batch = iter(processor.process_batch(jobs) if jobs else ())
+            try:
+                for index in range(len(sources)):
+                    failure = failures.get(index)
+                    yield failure if failure is not None else next(batch)
+            finally:
+                # Closing this generator cancels outstanding conversions
+                close = getattr(batch, "close", None)
+                if close is not None:
+                    close()
+            return
+
+        for source in sources:
+            try:
+                result = self.process_file(source, raw_dir, output_dir)
+            except Exception as e:
+                result = _unexpected_failure(source, e)
+            yield result
+
     def compute_docling_output_path(
         self,
         source: Path,
@@ -94,3 +161,9 @@ class OutputMirrorService:
             Path where the converted Markdown file would be written.
         """
         return self._filesystem.compute_output_path(source, raw_dir, output_dir)
+
+
+def _unexpected_failure(source: Path, error: Exception) -> ProcessingResult:
+    """Log an unexpected per-file exception and report it as a failed result."""
+    logger.exception("Unexpected error processing %s", source, exc_info=error)
+    return ProcessingResult(source_path=source, status="failed", error=str(error))
@@ -14,7 +14,7 @@ from pathlib import Path
 
 from nest import __version__
 from nest.adapters.protocols import FileSystemProtocol, ManifestProtocol
-from nest.core.checksum import compute_sha256
+from nest.core.checksum import compute_sha256_many
 from nest.core.models import Manifest
 from nest.core.orphan_detector import OrphanDetector
 from nest.core.paths import (
@@ -121,20 +121,25 @@ class StatusService:
         if not self._filesystem.exists(sources_dir):
             return (0, 0, 0, 0)
 
-        supported = {ext.lower() for ext in ALL_SOURCE_EXTENSIONS}
+        # Tuple form lets str.endswith match every extension in one C call,
+        # without building a suffix string per path as Path.suffix does
+        supported = tuple({ext.lower() for ext in ALL_SOURCE_EXTENSIONS})
         source_files = [
-            p for p in self._filesystem.list_files(sources_dir) if p.suffix.lower() in supported
+            path
+            for path in self._filesystem.list_files(sources_dir)
+            if path.name.lower().endswith(supported)
         ]
 
         new_count = 0
         modified_count = 0
         unchanged_count = 0
 
+        checksums = compute_sha256_many(source_files)
+
         for source_path in source_files:
             key = source_path.relative_to(sources_dir).as_posix()
-            try:
-                checksum = compute_sha256(source_path)
-            except (OSError, PermissionError):
+            checksum = checksums.get(source_path)
+            if checksum is None:
                 # If unreadable, treat as unchanged for status (don’t block status).
                 unchanged_count += 1
                 continue
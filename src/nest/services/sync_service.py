@@ -3,13 +3,20 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import closing
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
 from docling_core.types.doc.base import ImageRefMode
 
 from nest.core.exceptions import ProcessingError
-from nest.core.models import DiscoveredFile, DiscoveryResult, DryRunResult, SyncResult
+from nest.core.models import (
+    DiscoveredFile,
+    DiscoveryResult,
+    DryRunResult,
+    ProcessingResult,
+    SyncResult,
+)
 from nest.core.paths import (
     CONTEXT_DIR,
     GLOSSARY_FILE,
@@ -148,6 +155,9 @@ class SyncService:
             )
 
         files_to_process = changes.new_files + changes.modified_files
+        self._manifest.record_source_stats(
+            [*files_to_process, *changes.unchanged_files],
+        )
         skipped_count = len(changes.unchanged_files)
         processed_count = 0
         failed_count = 0
@@ -181,67 +191,32 @@ class SyncService:
         # Phase 1: Process all files; collect vision-eligible docling files for Phase 2
         deferred_vision: list[tuple[DiscoveredFile, Any, Path]] = []
 
+        # Standard docling files are converted together after the loop so the
+        # processor can spread them across CPU cores.
+        docling_batch: list[DiscoveredFile] = []
+
         for file_info in files_to_process:
             if is_passthrough_extension(file_info.path.suffix):
-                # Passthrough files always use the standard output path
+                # Passthrough files always use the standard output path.
+                # Unexpected errors are handled as in process_files: logged
+                # with a traceback and recorded as a failed result.
                 try:
                     result = self._output.process_file(file_info.path, raw_inbox, output_dir)
-
-                    if progress_callback is not None:
-                        progress_callback(file_info.path.name)
-
-                    if result.status == "success":
-                        if result.output_path is None:
-                            logger.error(
-                                "Processing succeeded but output_path is None: %s",
-                                file_info.path,
-                            )
-                            self._manifest.record_failure(
-                                file_info.path,
-                                file_info.checksum,
-                                "Internal error: output_path missing",
-                            )
-                            failed_count += 1
-                        else:
-                            self._manifest.record_success(
-                                file_info.path,
-                                file_info.checksum,
-                                result.output_path,
-                            )
-                            processed_count += 1
-                    elif result.status == "failed":
-                        error_msg = result.error or "Unknown error"
-                        self._manifest.record_failure(
-                            file_info.path,
-                            file_info.checksum,
-                            error_msg,
-                        )
-                        failed_count += 1
-                        if self._error_logger:
-                            log_processing_error(self._error_logger, file_info.path, error_msg)
-                        if on_error == "fail":
-                            raise ProcessingError(
-                                f"Processing failed for {file_info.path.name}: {error_msg}",
-                                source_path=file_info.path,
-                            )
-                    else:
-                        self._manifest.record_failure(
-                            file_info.path,
-                            file_info.checksum,
-                            result.error or "Unknown error",
-                        )
-                        failed_count += 1
                 except ProcessingError:
                     raise
                 except Exception as e:
                     logger.exception("Unexpected error processing %s", file_info.path)
-                    error_msg = str(e)
-                    self._manifest.record_failure(file_info.path, file_info.checksum, error_msg)
+                    result = ProcessingResult(
+                        source_path=file_info.path, status="failed", error=str(e)
+                    )
+
+                if progress_callback is not None:
+                    progress_callback(file_info.path.name)
+
+                if self._record_result(file_info, result, on_error):
+                    processed_count += 1
+                else:
                     failed_count += 1
-                    if self._error_logger:
-                        log_processing_error(self._error_logger, file_info.path, error_msg)
-                    if on_error == "fail":
-                        raise
 
             elif (
                 self._picture_description_service is not None
@@ -273,64 +248,22 @@ class SyncService:
 
             else:
                 # Standard docling path (no vision)
-                try:
-                    result = self._output.process_file(file_info.path, raw_inbox, output_dir)
+                docling_batch.append(file_info)
 
+        if docling_batch:
+            results = self._output.process_files(
+                [file_info.path for file_info in docling_batch], raw_inbox, output_dir
+            )
+            # closing() cancels outstanding conversions if on_error="fail" aborts early
+            with closing(results):
+                for file_info, result in zip(docling_batch, results, strict=True):
                     if progress_callback is not None:
                         progress_callback(file_info.path.name)
 
-                    if result.status == "success":
-                        if result.output_path is None:
-                            logger.error(
-                                "Processing succeeded but output_path is None: %s",
-                                file_info.path,
-                            )
-                            self._manifest.record_failure(
-                                file_info.path,
-                                file_info.checksum,
-                                "Internal error: output_path missing",
-                            )
-                            failed_count += 1
-                        else:
-                            self._manifest.record_success(
-                                file_info.path,
-                                file_info.checksum,
-                                result.output_path,
-                            )
-                            processed_count += 1
-                    elif result.status == "failed":
-                        error_msg = result.error or "Unknown error"
-                        self._manifest.record_failure(
-                            file_info.path,
-                            file_info.checksum,
-                            error_msg,
-                        )
-                        failed_count += 1
-                        if self._error_logger:
-                            log_processing_error(self._error_logger, file_info.path, error_msg)
-                        if on_error == "fail":
-                            raise ProcessingError(
-                                f"Processing failed for {file_info.path.name}: {error_msg}",
-                                source_path=file_info.path,
-                            )
+                    if self._record_result(file_info, result, on_error):
+                        processed_count += 1
                     else:
-                        self._manifest.record_failure(
-                            file_info.path,
-                            file_info.checksum,
-                            result.error or "Unknown error",
-                        )
                         failed_count += 1
-                except ProcessingError:
-                    raise
-                except Exception as e:
-                    logger.exception("Unexpected error processing %s", file_info.path)
-                    error_msg = str(e)
-                    self._manifest.record_failure(file_info.path, file_info.checksum, error_msg)
-                    failed_count += 1
-                    if self._error_logger:
-                        log_processing_error(self._error_logger, file_info.path, error_msg)
-                    if on_error == "fail":
-                        raise
 
         # Phase 2: Run image descriptions concurrently across deferred vision files
         if deferred_vision:
@@ -546,6 +479,67 @@ class SyncService:
             images_skipped=images_skipped,
         )
 
+    def _record_result(
+        self,
+        file_info: DiscoveredFile,
+        result: ProcessingResult,
+        on_error: Literal["skip", "fail"],
+    ) -> bool:
+        """Record a processing result in the manifest.
+
+        Args:
+            file_info: The discovered file that was processed.
+            result: ProcessingResult returned by the output service.
+            on_error: Error handling strategy ("skip" or "fail").
+
+        Returns:
+            True if the file was processed successfully, False if it failed.
+
+        Raises:
+            ProcessingError: If on_error="fail" and the file failed processing.
+        """
+        if result.status == "success":
+            if result.output_path is None:
+                logger.error(
+                    "Processing succeeded but output_path is None: %s",
+                    file_info.path,
+                )
+                self._manifest.record_failure(
+                    file_info.path,
+                    file_info.checksum,
+                    "Internal error: output_path missing",
+                )
+                return False
+            self._manifest.record_success(
+                file_info.path,
+                file_info.checksum,
+                result.output_path,
+            )
+            return True
+
+        if result.status == "failed":
+            error_msg = result.error or "Unknown error"
+            self._manifest.record_failure(
+                file_info.path,
+                file_info.checksum,
+                error_msg,
+            )
+            if self._error_logger:
+                log_processing_error(self._error_logger, file_info.path, error_msg)
+            if on_error == "fail":
+                raise ProcessingError(
+                    f"Processing failed for {file_info.path.name}: {error_msg}",
+                    source_path=file_info.path,
+                )
+            return False
+
+        self._manifest.record_failure(
+            file_info.path,
+            file_info.checksum,
+            result.error or "Unknown error",
+        )
+        return False
+
     def _run_glossary(self, changed_files: list[Path], context_dir: Path) -> AIGlossaryResult:
         """Run AI glossary generation.
 
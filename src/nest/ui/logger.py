@@ -8,10 +8,40 @@ This module is for diagnostic/error log files only.
 """
 
 import logging
+import os
 from pathlib import Path
 
 from nest.core.paths import ERROR_LOG_FILENAME, NEST_META_DIR
 
+# One append handle per log file for the life of the process, keyed by
+# absolute path. Re-running setup reuses it instead of opening another.
+_FILE_HANDLERS: dict[str, logging.FileHandler] = {}
+
+
+def _get_file_handler(log_file: Path) -> logging.FileHandler:
+    """Return the shared append handler for a log file, opening it once."""
+    key = os.path.abspath(log_file)
+    handler = _FILE_HANDLERS.get(key)
+    if handler is not None and handler.stream is not None and not os.path.exists(key):
+        # File was removed or moved since it was opened; start a fresh one
+        handler.close()
+        handler = None
+    if handler is None:
+        # delay=True: the file is only created when the first error is
+        # emitted, so clean runs never touch the disk
+        handler = logging.FileHandler(key, mode="a", encoding="utf-8", delay=True)
+        handler.setLevel(logging.ERROR)
+
+        # Format: 2026-01-12T10:30:00 ERROR [sync] message
+        handler.setFormatter(
+            logging.Formatter(
+                fmt="%(asctime)s %(levelname)s [%(service)s] %(message)s",
+                datefmt="%Y-%m-%dT%H:%M:%S",
+            )
+        )
+        _FILE_HANDLERS[key] = handler
+    return handler
+
 
 def setup_error_logger(
     log_file: Path | None = None,
@@ -19,8 +49,10 @@ def setup_error_logger(
 ) -> logging.LoggerAdapter[logging.Logger]:
     """Setup file logger for error tracking.
 
-    Creates or appends to an error log file with ISO timestamp format.
-    Each call creates a new logger instance with its own file handler.
+    Appends to an error log file with ISO timestamp format. The file is
+    opened (and created) on the first logged error, not at setup. Calls for
+    the same log file share one append handler, so repeated setup (and every
+    logged error) reuses a single file descriptor.
 
     Args:
         log_file: Path to the log file. Defaults to .nest/errors.log in cwd.
@@ -32,26 +64,18 @@ def setup_error_logger(
     if log_file is None:
         log_file = Path(NEST_META_DIR) / ERROR_LOG_FILENAME
 
+    handler = _get_file_handler(log_file)
+
     # Use a dedicated namespace outside the legacy error-logger hierarchy.
-    logger_name = f"nest.error_log.{service_name}.{id(log_file)}"
+    logger_name = f"nest.error_log.{service_name}.{id(handler)}"
     logger = logging.getLogger(logger_name)
     logger.setLevel(logging.ERROR)
     logger.propagate = False
 
-    # Clear any existing handlers to prevent duplicates
+    # Clear any existing handlers to prevent duplicates. The shared file
+    # handler stays open; it is owned by _FILE_HANDLERS, not this logger.
     if logger.hasHandlers():
         logger.handlers.clear()
-
-    # Create file handler that appends
-    handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
-    handler.setLevel(logging.ERROR)
-
-    # Format: 2026-01-12T10:30:00 ERROR [sync] message
-    formatter = logging.Formatter(
-        fmt="%(asctime)s %(levelname)s [%(service)s] %(message)s",
-        datefmt="%Y-%m-%dT%H:%M:%S",
-    )
-    handler.setFormatter(formatter)
     logger.addHandler(handler)
 
     # Store service name for use in log entries
@@ -75,6 +75,10 @@ class SyncProgress:
         Args:
             total: Total number of files to process.
         """
+        if self._disabled:
+            # Nothing to render; advance() and finish() are no-ops without a bar
+            return
+
         self._progress = Progress(
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
@@ -82,7 +86,6 @@ class SyncProgress:
             TextColumn("({task.completed}/{task.total})"),
             TextColumn("[cyan]{task.fields[current_file]}[/cyan]"),
             console=self._console,
-            disable=self._disabled,
         )
         self._progress.start()
         self._task_id = self._progress.add_task(
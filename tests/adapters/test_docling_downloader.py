@@ -39,6 +39,23 @@ class TestDoclingModelDownloader:
             result = downloader.are_models_cached()
         assert result is False
 
+    def test_are_models_cached_remembers_positive_result(self, tmp_path: Path) -> None:
+        """Once models are found, later calls skip the folder probes."""
+        downloader = DoclingModelDownloader()
+        (tmp_path / "models" / "docling-project--docling-models").mkdir(parents=True)
+        with patch(_SETTINGS_TARGET, return_value=_mock_settings(tmp_path)):
+            assert downloader.are_models_cached() is True
+            with patch.object(Path, "exists", side_effect=AssertionError("probed")):
+                assert downloader.are_models_cached() is True
+
+    def test_are_models_cached_reprobes_after_negative_result(self, tmp_path: Path) -> None:
+        """A miss is not remembered, so a later download is picked up."""
+        downloader = DoclingModelDownloader()
+        with patch(_SETTINGS_TARGET, return_value=_mock_settings(tmp_path)):
+            assert downloader.are_models_cached() is False
+            (tmp_path / "models" / "docling-project--docling-models").mkdir(parents=True)
+            assert downloader.are_models_cached() is True
+
     def test_get_cache_path_returns_models_directory(self, tmp_path: Path) -> None:
         """Test cache path returns settings.cache_dir/models."""
         downloader = DoclingModelDownloader()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -11,8 +13,20 @@ from nest.adapters.protocols import DocumentProcessorProtocol
 from nest.core.models import ProcessingResult
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from nest.adapters.docling_processor import DoclingProcessor
+
+
+@pytest.fixture(autouse=True)
+def _release_shared_converters() -> Iterator[None]:
+    """Isolate tests from converters cached by other tests (or mocked ones)."""
     from nest.adapters.docling_processor import DoclingProcessor
 
+    DoclingProcessor.release_models()
+    yield
+    DoclingProcessor.release_models()
+
 
 class TestDocumentProcessorProtocolExists:
     """Tests that DocumentProcessorProtocol is properly defined."""
@@ -515,3 +529,123 @@ class TestDoclingProcessorProtocolComplianceWithClassification:
         from nest.adapters.docling_processor import DoclingProcessor
 
         assert isinstance(DoclingProcessor(enable_classification=True), DocumentProcessorProtocol)
+
+
+class TestDoclingProcessorProcessBatch:
+    """Tests for process_batch() parallel conversion."""
+
+    def test_single_worker_processes_in_order_in_process(self, tmp_path: Path) -> None:
+        """max_workers=1 converts sequentially without spawning workers."""
+        from unittest.mock import MagicMock, patch
+
+        with (
+            patch("nest.adapters.docling_processor.DocumentConverter") as mock_cls,
+            patch("nest.adapters.docling_processor.ProcessPoolExecutor") as mock_pool,
+        ):
+            from nest.adapters.docling_processor import DoclingProcessor
+
+            mock_result = MagicMock()
+            mock_result.document.export_to_markdown.return_value = "# Hello"
+            mock_cls.return_value.convert.return_value = mock_result
+
+            processor = DoclingProcessor()
+            jobs = [(tmp_path / f"{name}.pdf", tmp_path / f"{name}.md") for name in "abc"]
+
+            results = list(processor.process_batch(jobs, max_workers=1))
+
+            mock_pool.assert_not_called()
+            assert [r.source_path for r in results] == [source for source, _ in jobs]
+            assert all(r.status == "success" for r in results)
+
+    def test_worker_pool_is_capped_and_pins_threads(self, tmp_path: Path) -> None:
+        """The default pool stays small and each worker is limited to a few threads."""
+        from unittest.mock import MagicMock, patch
+
+        with (
+            patch("nest.adapters.docling_processor.DocumentConverter"),
+            patch("nest.adapters.docling_processor.os.cpu_count", return_value=64),
+            patch("nest.adapters.docling_processor.ProcessPoolExecutor") as mock_pool,
+        ):
+            from nest.adapters.docling_processor import (
+                _DEFAULT_MAX_WORKERS,
+                _WORKER_THREADS,
+                DoclingProcessor,
+                _init_worker,
+            )
+
+            def submit(fn, source, output, enable_classification):  # noqa: ANN001, ANN202
+                future = MagicMock()
+                future.result.return_value = ProcessingResult(source_path=source, status="success")
+                return future
+
+            mock_pool.return_value.submit.side_effect = submit
+            jobs = [(tmp_path / f"{i}.pdf", tmp_path / f"{i}.md") for i in range(10)]
+
+            results = list(DoclingProcessor().process_batch(jobs))
+
+            kwargs = mock_pool.call_args.kwargs
+            assert kwargs["max_workers"] == _DEFAULT_MAX_WORKERS
+            assert kwargs["initializer"] is _init_worker
+            assert kwargs["initargs"] == (_WORKER_THREADS,)
+            assert [r.source_path for r in results] == [source for source, _ in jobs]
+
+    def test_constructor_max_workers_sets_pool_size(self, tmp_path: Path) -> None:
+        """max_workers given at construction is used when process_batch gets none."""
+        from unittest.mock import MagicMock, patch
+
+        with (
+            patch("nest.adapters.docling_processor.DocumentConverter"),
+            patch("nest.adapters.docling_processor.ProcessPoolExecutor") as mock_pool,
+        ):
+            from nest.adapters.docling_processor import DoclingProcessor
+
+            mock_pool.return_value.submit.return_value = MagicMock()
+            jobs = [(tmp_path / f"{i}.pdf", tmp_path / f"{i}.md") for i in range(5)]
+
+            list(DoclingProcessor(max_workers=3).process_batch(jobs))
+
+            assert mock_pool.call_args.kwargs["max_workers"] == 3
+
+    def test_init_worker_limits_threads(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The pool initializer sets OMP_NUM_THREADS for the worker."""
+        from nest.adapters.docling_processor import _init_worker
+
+        monkeypatch.delenv("OMP_NUM_THREADS", raising=False)
+        monkeypatch.setitem(sys.modules, "torch", None)
+
+        _init_worker(2)
+
+        assert os.environ["OMP_NUM_THREADS"] == "2"
+
+
+class TestDoclingProcessorSharedConverter:
+    """Tests for the process-wide converter cache."""
+
+    def test_processors_with_same_config_share_converter(self) -> None:
+        """Constructing a second processor reuses the existing converter."""
+        from unittest.mock import MagicMock, patch
+
+        with patch("nest.adapters.docling_processor.DocumentConverter") as mock_cls:
+            from nest.adapters.docling_processor import DoclingProcessor
+
+            mock_cls.side_effect = lambda **kwargs: MagicMock()
+            first = DoclingProcessor()
+            second = DoclingProcessor()
+            classifying = DoclingProcessor(enable_classification=True)
+
+            assert first._converter is second._converter
+            assert classifying._converter is not first._converter
+            assert mock_cls.call_count == 2
+
+    def test_release_models_drops_shared_converters(self) -> None:
+        """release_models() forces the next processor to build a new converter."""
+        from unittest.mock import patch
+
+        with patch("nest.adapters.docling_processor.DocumentConverter") as mock_cls:
+            from nest.adapters.docling_processor import DoclingProcessor
+
+            DoclingProcessor()
+            DoclingProcessor.release_models()
+            DoclingProcessor()
+
+            assert mock_cls.call_count == 2
@@ -1,5 +1,6 @@
 """Tests for file discovery adapter."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -68,6 +69,21 @@ class TestFileDiscoveryAdapter:
         # Assert
         assert len(result) == 3
 
+    def test_matches_only_final_extension(self, tmp_path: Path) -> None:
+        """Multi-dot names match on their last suffix only."""
+        # Arrange
+        (tmp_path / "report.v2.PDF").write_bytes(b"pdf")
+        (tmp_path / "notes.pdf.bak").write_bytes(b"bak")
+        (tmp_path / "pdf").write_bytes(b"no dot")
+
+        adapter = FileDiscoveryAdapter()
+
+        # Act
+        result = adapter.discover(tmp_path, {".pdf"})
+
+        # Assert
+        assert [p.name for p in result] == ["report.v2.PDF"]
+
     def test_ignores_hidden_files(self, tmp_path: Path) -> None:
         """Verify files starting with . are excluded."""
         # Arrange
@@ -244,3 +260,23 @@ class TestFileDiscoveryAdapter:
         assert len(result) == 1
         assert result[0].name == "good.pdf"
         assert any("broken symlink" in rec.message.lower() for rec in caplog.records)
+
+    def test_does_not_descend_into_hidden_directories(self, tmp_path: Path) -> None:
+        """Hidden directories are pruned at the walk level, not filtered per file."""
+        from unittest.mock import patch
+
+        # Arrange
+        (tmp_path / "visible.pdf").write_bytes(b"pdf")
+        (tmp_path / ".git" / "objects").mkdir(parents=True)
+        (tmp_path / ".git" / "objects" / "pack.pdf").write_bytes(b"pdf")
+
+        adapter = FileDiscoveryAdapter()
+
+        # Act
+        with patch("nest.adapters.file_discovery.os.scandir", wraps=os.scandir) as spy:
+            result = adapter.discover(tmp_path, {".pdf"})
+
+        # Assert
+        assert [p.name for p in result] == ["visible.pdf"]
+        scanned = [Path(call.args[0]) for call in spy.call_args_list]
+        assert scanned == [tmp_path]
@@ -4,9 +4,13 @@ Tests the FileSystemAdapter implementation including
 path computation methods for output mirroring.
 """
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
-from nest.adapters.filesystem import FileSystemAdapter
+import pytest
+
+from nest.adapters.filesystem import FileSystemAdapter, copy_file, walk_entries
 from nest.adapters.protocols import FileSystemProtocol
 
 
@@ -37,6 +41,15 @@ class TestFileSystemAdapter:
 
         assert file_path.read_text() == "Hello, World!"
 
+    def test_write_text_creates_missing_parents(self, tmp_path: Path) -> None:
+        """Verify write_text creates parent directories on demand."""
+        adapter = FileSystemAdapter()
+        file_path = tmp_path / "a" / "b" / "test.txt"
+
+        adapter.write_text(file_path, "nested")
+
+        assert file_path.read_text() == "nested"
+
     def test_read_text(self, tmp_path: Path) -> None:
         """Verify text file reading."""
         adapter = FileSystemAdapter()
@@ -62,6 +75,47 @@ class TestFileSystemAdapter:
 
         assert adapter.exists(file_path) is False
 
+    def test_exists_many_reads_each_parent_once(self, tmp_path: Path) -> None:
+        """Verify exists_many answers in input order with one scandir per parent."""
+        adapter = FileSystemAdapter()
+        (tmp_path / "a.md").write_text("a")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.md").write_text("b")
+        paths = [
+            tmp_path / "a.md",
+            tmp_path / "sub" / "b.md",
+            tmp_path / "missing.md",
+            tmp_path / "nodir" / "c.md",
+        ]
+
+        with patch("nest.adapters.filesystem.os.scandir", wraps=os.scandir) as spy:
+            result = adapter.exists_many(paths)
+
+        assert result == [True, True, False, False]
+        assert spy.call_count == 3
+
+    def test_exists_many_matches_exists_for_symlinks(self, tmp_path: Path) -> None:
+        """Verify a dangling symlink is missing and a live one exists, as with exists()."""
+        adapter = FileSystemAdapter()
+        (tmp_path / "target.md").write_text("t")
+        (tmp_path / "live.md").symlink_to(tmp_path / "target.md")
+        (tmp_path / "dangling.md").symlink_to(tmp_path / "gone.md")
+        paths = [tmp_path / "live.md", tmp_path / "dangling.md"]
+
+        assert adapter.exists_many(paths) == [adapter.exists(path) for path in paths]
+        assert adapter.exists_many(paths) == [True, False]
+
+    def test_exists_many_falls_back_to_stat_for_unlisted_names(self, tmp_path: Path) -> None:
+        """Verify a name missing from the listing is still checked with a stat."""
+        adapter = FileSystemAdapter()
+        (tmp_path / "a.md").write_text("a")
+
+        with patch("nest.adapters.filesystem.os.path.exists", return_value=True) as spy:
+            result = adapter.exists_many([tmp_path / "a.md", tmp_path / "A.MD"])
+
+        assert result == [True, True]
+        spy.assert_called_once_with(tmp_path / "A.MD")
+
     def test_append_text(self, tmp_path: Path) -> None:
         """Verify text appending to file."""
         adapter = FileSystemAdapter()
@@ -122,6 +176,31 @@ class TestFileSystemAdapter:
         assert len(result) == 1
         assert tmp_path / "visible.txt" in result
 
+    def test_list_files_does_not_enter_hidden_directories(self, tmp_path: Path) -> None:
+        """Verify list_files prunes hidden directories instead of filtering their files."""
+        adapter = FileSystemAdapter()
+        (tmp_path / "visible.txt").write_text("a")
+        (tmp_path / ".git" / "objects").mkdir(parents=True)
+        (tmp_path / ".git" / "objects" / "blob").write_text("b")
+
+        with patch("nest.adapters.filesystem.os.scandir", wraps=os.scandir) as spy:
+            result = adapter.list_files(tmp_path)
+
+        assert result == [tmp_path / "visible.txt"]
+        scanned = [Path(call.args[0]) for call in spy.call_args_list]
+        assert scanned == [tmp_path]
+
+    def test_list_files_does_not_follow_symlinked_directories(self, tmp_path: Path) -> None:
+        """Verify a symlink cycle neither recurses nor shows up as a file."""
+        adapter = FileSystemAdapter()
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "file.txt").write_text("a")
+        (tmp_path / "sub" / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+        result = adapter.list_files(tmp_path)
+
+        assert result == [tmp_path / "sub" / "file.txt"]
+
     def test_list_files_excludes_directories(self, tmp_path: Path) -> None:
         """Verify list_files returns only files, not directories."""
         adapter = FileSystemAdapter()
@@ -154,6 +233,94 @@ class TestFileSystemAdapter:
         assert result == []
 
 
+class TestWalkEntries:
+    """Tests for the shared walk_entries scandir walker."""
+
+    def test_descends_into_hidden_directories_by_default(self, tmp_path: Path) -> None:
+        """Hidden directories are walked; only hidden names are filtered."""
+        (tmp_path / ".meta").mkdir()
+        (tmp_path / ".meta" / "visible.txt").write_text("a")
+        (tmp_path / ".meta" / ".hidden").write_text("b")
+
+        result = [Path(entry.path) for entry in walk_entries(tmp_path)]
+
+        assert result == [tmp_path / ".meta" / "visible.txt"]
+
+    def test_skip_hidden_dirs_prunes_them(self, tmp_path: Path) -> None:
+        """skip_hidden_dirs stops the walk from entering dot-directories."""
+        (tmp_path / ".meta").mkdir()
+        (tmp_path / ".meta" / "visible.txt").write_text("a")
+        (tmp_path / "doc.txt").write_text("b")
+
+        result = [Path(entry.path) for entry in walk_entries(tmp_path, skip_hidden_dirs=True)]
+
+        assert result == [tmp_path / "doc.txt"]
+
+    def test_yields_in_path_sort_order(self, tmp_path: Path) -> None:
+        """Per-directory sorting matches sorted() over the full path list."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "b.txt").write_text("x")
+        (tmp_path / "a.txt").write_text("x")
+        (tmp_path / "a-b.txt").write_text("x")
+        (tmp_path / "B").mkdir()
+        (tmp_path / "B" / "z.txt").write_text("x")
+        (tmp_path / "c.txt").write_text("x")
+
+        result = [Path(entry.path) for entry in walk_entries(tmp_path)]
+
+        assert result == sorted(result)
+        assert len(result) == 5
+
+    def test_missing_root_yields_nothing(self, tmp_path: Path) -> None:
+        """A root that does not exist produces an empty walk."""
+        assert list(walk_entries(tmp_path / "missing")) == []
+
+
+class TestCopyFile:
+    """Tests for copy_file."""
+
+    def test_copies_bytes_verbatim(self, tmp_path: Path) -> None:
+        """Binary content is copied verbatim."""
+        src = tmp_path / "doc.pdf"
+        src.write_bytes(b"%PDF-1.7\x00\xff" * 1000)
+        dst = tmp_path / "doc-copy.pdf"
+
+        copy_file(src, dst)
+
+        assert dst.read_bytes() == src.read_bytes()
+
+    def test_preserves_modification_time(self, tmp_path: Path) -> None:
+        """Metadata is copied like shutil.copy2."""
+        src = tmp_path / "a.txt"
+        src.write_text("a")
+        os.utime(src, (1_000_000_000, 1_000_000_000))
+        dst = tmp_path / "b.txt"
+
+        copy_file(src, dst)
+
+        assert dst.stat().st_mtime == 1_000_000_000
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="Linux-only syscall")
+    def test_falls_back_when_copy_file_range_unsupported(self, tmp_path: Path) -> None:
+        """An OSError from copy_file_range falls back to shutil.copyfile."""
+        src = tmp_path / "a.bin"
+        src.write_bytes(b"payload")
+        dst = tmp_path / "b.bin"
+
+        with patch(
+            "nest.adapters.filesystem.os.copy_file_range",
+            side_effect=OSError(18, "Invalid cross-device link"),
+        ):
+            copy_file(src, dst)
+
+        assert dst.read_bytes() == b"payload"
+
+    def test_missing_source_raises(self, tmp_path: Path) -> None:
+        """A missing source surfaces FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            copy_file(tmp_path / "missing.txt", tmp_path / "out.txt")
+
+
 class TestGetRelativePath:
     """Tests for get_relative_path method."""
 
@@ -4,6 +4,7 @@ Tests manifest file operations including error handling.
 """
 
 import json
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -68,6 +69,18 @@ class TestManifestAdapterLoad:
 
         assert "nest doctor" in str(exc_info.value).lower()
 
+    def test_load_raises_manifest_error_when_structure_invalid(self, tmp_path: Path) -> None:
+        """Well-formed JSON with the wrong shape is reported as invalid structure."""
+        # Arrange
+        meta_dir = tmp_path / ".nest"
+        meta_dir.mkdir()
+        (meta_dir / "manifest.json").write_text(json.dumps({"files": "not-a-dict"}))
+        adapter = ManifestAdapter()
+
+        # Act & Assert
+        with pytest.raises(ManifestError, match="invalid structure"):
+            adapter.load(tmp_path)
+
     def test_load_raises_file_not_found_when_missing(self, tmp_path: Path) -> None:
         """FileNotFoundError when manifest file doesn't exist."""
         # Arrange
@@ -105,7 +118,7 @@ class TestManifestAdapterSave:
     """Tests for ManifestAdapter.save() write behavior."""
 
     def test_save_writes_manifest_with_lf_newlines(self, tmp_path: Path) -> None:
-        """Manifest writes pass newline='\n' explicitly for cross-platform stability."""
+        """Manifest bytes use LF newlines regardless of platform."""
         adapter = ManifestAdapter()
         manifest = Manifest(
             nest_version="1.0.0",
@@ -113,12 +126,91 @@ class TestManifestAdapterSave:
             files={},
         )
 
-        with patch(
-            "pathlib.Path.write_text",
-            autospec=True,
-            wraps=Path.write_text,
-        ) as mock_write_text:
+        adapter.save(tmp_path, manifest)
+
+        raw = (tmp_path / ".nest" / "manifest.json").read_bytes()
+        assert b"\n" in raw
+        assert b"\r\n" not in raw
+
+    def test_save_replaces_manifest_atomically(self, tmp_path: Path) -> None:
+        """Save writes a temp file, then moves it over the manifest."""
+        adapter = ManifestAdapter()
+        manifest = Manifest(nest_version="1.0.0", last_sync=None, files={})
+
+        with patch("nest.adapters.manifest.os.replace", wraps=os.replace) as mock_replace:
             adapter.save(tmp_path, manifest)
 
-        assert mock_write_text.call_args is not None
-        assert mock_write_text.call_args.kwargs["newline"] == "\n"
+        manifest_path = tmp_path / ".nest" / "manifest.json"
+        mock_replace.assert_called_once_with(
+            manifest_path.with_name("manifest.json.tmp"), manifest_path
+        )
+        assert not manifest_path.with_name("manifest.json.tmp").exists()
+        assert adapter.load(tmp_path) == manifest
+
+    def test_save_omits_unset_optional_fields(self, tmp_path: Path) -> None:
+        """None-valued fields are left out and parse back as None."""
+        adapter = ManifestAdapter()
+        manifest = Manifest.model_validate(
+            {
+                "nest_version": "1.0.0",
+                "files": {
+                    "doc.pdf": {
+                        "sha256": "abc123",
+                        "processed_at": "2026-01-01T00:00:00Z",
+                        "output": "doc.md",
+                        "status": "success",
+                    }
+                },
+            }
+        )
+
+        adapter.save(tmp_path, manifest)
+
+        raw = (tmp_path / ".nest" / "manifest.json").read_bytes()
+        data = json.loads(raw)
+        assert "last_sync" not in data
+        assert "error" not in data["files"]["doc.pdf"]
+        assert Manifest.model_validate_json(raw) == manifest
+
+
+class TestManifestAdapterCache:
+    """Tests for the stat-validated in-memory manifest cache."""
+
+    def test_unchanged_manifest_is_not_reparsed(self, tmp_path: Path) -> None:
+        """A second load of an unchanged file is served from the cache."""
+        adapter = ManifestAdapter()
+        adapter.save(tmp_path, Manifest(nest_version="1.0.0", last_sync=None, files={}))
+
+        with patch.object(
+            Manifest, "model_validate_json", wraps=Manifest.model_validate_json
+        ) as spy:
+            adapter.load(tmp_path)
+            adapter.load(tmp_path)
+
+        spy.assert_not_called()
+
+    def test_external_modification_is_detected(self, tmp_path: Path) -> None:
+        """Rewriting the file on disk invalidates the cached manifest."""
+        adapter = ManifestAdapter()
+        adapter.save(tmp_path, Manifest(nest_version="1.0.0", last_sync=None, files={}))
+        adapter.load(tmp_path)
+
+        manifest_path = tmp_path / ".nest" / "manifest.json"
+        manifest_path.write_text(
+            json.dumps({"nest_version": "2.0.0-external", "last_sync": None, "files": {}})
+        )
+
+        assert adapter.load(tmp_path).nest_version == "2.0.0-external"
+
+    def test_mutating_loaded_manifest_does_not_leak_into_cache(self, tmp_path: Path) -> None:
+        """Callers edit manifest.files freely; later loads still see the file's content."""
+        adapter = ManifestAdapter()
+        adapter.save(tmp_path, Manifest(nest_version="1.0.0", last_sync=None, files={}))
+
+        first = adapter.load(tmp_path)
+        first.files["stray.pdf"] = None  # type: ignore[assignment]
+        first.nest_version = "mutated"
+
+        second = adapter.load(tmp_path)
+        assert second.files == {}
+        assert second.nest_version == "1.0.0"
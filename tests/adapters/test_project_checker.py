@@ -1,6 +1,7 @@
 """Unit tests for ProjectChecker adapter."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -95,6 +96,14 @@ class TestAgentFileChecks:
         assert "nest-master-synthesizer.agent.md" in missing
         assert "nest-master-planner.agent.md" in missing
 
+    def test_missing_agent_files_ignores_directories_with_agent_names(self, tmp_path: Path) -> None:
+        """A directory named like an agent file does not count as present."""
+        agent_dir = tmp_path / AGENT_DIR
+        (agent_dir / "nest.agent.md").mkdir(parents=True)
+
+        checker = ProjectChecker()
+        assert "nest.agent.md" in checker.missing_agent_files(tmp_path)
+
 
 class TestFolderChecks:
     """Tests for folder structure validation."""
@@ -124,3 +133,57 @@ class TestFolderChecks:
         """context_folder_exists() should return False when folder missing."""
         checker = ProjectChecker()
         assert checker.context_folder_exists(tmp_path) is False
+
+
+class TestProjectMarkers:
+    """Tests for the single-listing project marker probe."""
+
+    def test_has_project_markers_false_for_plain_directory(self, tmp_path: Path) -> None:
+        """has_project_markers() should return False when no marker exists."""
+        (tmp_path / "notes.txt").write_text("x")
+        (tmp_path / ".github").mkdir()
+
+        checker = ProjectChecker()
+        assert checker.has_project_markers(tmp_path) is False
+
+    @pytest.mark.parametrize(
+        "marker",
+        ["_nest_sources", "_nest_context", ".nest_manifest.json", ".nest/manifest.json"],
+    )
+    def test_has_project_markers_true_for_each_marker(self, tmp_path: Path, marker: str) -> None:
+        """has_project_markers() should detect each marker on its own."""
+        path = tmp_path / marker
+        if marker.startswith("_"):
+            path.mkdir()
+        else:
+            path.parent.mkdir(exist_ok=True)
+            path.write_text("{}")
+
+        checker = ProjectChecker()
+        assert checker.has_project_markers(tmp_path) is True
+
+    def test_has_project_markers_true_when_all_agent_files_exist(self, tmp_path: Path) -> None:
+        """has_project_markers() should detect a complete set of agent files."""
+        agent_dir = tmp_path / AGENT_DIR
+        agent_dir.mkdir(parents=True)
+        for filename in AGENT_FILES:
+            (agent_dir / filename).write_text("agent")
+
+        checker = ProjectChecker()
+        assert checker.has_project_markers(tmp_path) is True
+
+    def test_has_project_markers_skips_listing_when_manifest_exists(self, tmp_path: Path) -> None:
+        """has_project_markers() should not list the directory for a real project."""
+        (tmp_path / ".nest").mkdir()
+        (tmp_path / ".nest" / "manifest.json").write_text("{}")
+
+        checker = ProjectChecker()
+        with patch("nest.adapters.project_checker.os.scandir") as mock_scandir:
+            assert checker.has_project_markers(tmp_path) is True
+
+        mock_scandir.assert_not_called()
+
+    def test_has_project_markers_false_for_missing_directory(self, tmp_path: Path) -> None:
+        """has_project_markers() should return False when the directory is missing."""
+        checker = ProjectChecker()
+        assert checker.has_project_markers(tmp_path / "missing") is False
@@ -84,24 +84,16 @@ class TestGenerate:
         content = mock_filesystem.written_files[output_path]
         assert "name: nest-master-coordinator" in content
 
-    def test_generate_creates_parent_directory(self, mock_filesystem: MockFileSystem) -> None:
-        writer = VSCodeAgentWriter(filesystem=mock_filesystem)
-        output_path = Path("/project/.github/agents/nest.agent.md")
-
-        writer.generate(output_path)
-
-        assert Path("/project/.github/agents") in mock_filesystem.created_dirs
-
-    def test_generate_skips_directory_creation_if_exists(
+    def test_generate_leaves_directory_creation_to_write_text(
         self, mock_filesystem: MockFileSystem
     ) -> None:
-        mock_filesystem.existing_paths.add(Path("/project/.github/agents"))
         writer = VSCodeAgentWriter(filesystem=mock_filesystem)
         output_path = Path("/project/.github/agents/nest.agent.md")
 
         writer.generate(output_path)
 
-        assert Path("/project/.github/agents") not in mock_filesystem.created_dirs
+        assert mock_filesystem.created_dirs == []
+        assert output_path in mock_filesystem.written_files
 
     def test_generate_includes_required_instructions(self, mock_filesystem: MockFileSystem) -> None:
         writer = VSCodeAgentWriter(filesystem=mock_filesystem)
@@ -264,27 +256,16 @@ class TestGenerateAll:
         for agent_file in AGENT_FILES:
             assert output_dir / agent_file in mock_filesystem.written_files
 
-    def test_generate_all_creates_directory_if_missing(
-        self, mock_filesystem: MockFileSystem
-    ) -> None:
-        """AC5: generate_all() creates output directory if it doesn't exist."""
-        writer = VSCodeAgentWriter(filesystem=mock_filesystem)
-        output_dir = Path("/project/.github/agents")
-
-        writer.generate_all(output_dir)
-
-        assert output_dir in mock_filesystem.created_dirs
-
-    def test_generate_all_skips_directory_creation_if_exists(
+    def test_generate_all_leaves_directory_creation_to_write_text(
         self, mock_filesystem: MockFileSystem
     ) -> None:
-        mock_filesystem.existing_paths.add(Path("/project/.github/agents"))
+        """AC5: generate_all() relies on write_text to create the output directory."""
         writer = VSCodeAgentWriter(filesystem=mock_filesystem)
         output_dir = Path("/project/.github/agents")
 
         writer.generate_all(output_dir)
 
-        assert output_dir not in mock_filesystem.created_dirs
+        assert mock_filesystem.created_dirs == []
 
     def test_generate_all_content_matches_render_all(self, mock_filesystem: MockFileSystem) -> None:
         writer = VSCodeAgentWriter(filesystem=mock_filesystem)
@@ -0,0 +1,26 @@
+"""Tests for helpers shared by CLI commands."""
+
+from pathlib import Path
+
+import pytest
+
+from nest.cli._common import resolve_project_root
+
+
+class TestResolveProjectRoot:
+    """Tests for resolve_project_root function."""
+
+    def test_defaults_to_cwd(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """No target directory means the current working directory."""
+        monkeypatch.chdir(tmp_path)
+
+        assert resolve_project_root(None) == tmp_path.resolve()
+
+    def test_resolves_explicit_directory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A relative --dir is made absolute against the cwd."""
+        (tmp_path / "project").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        assert resolve_project_root(Path("project")) == (tmp_path / "project").resolve()
@@ -400,3 +400,35 @@ class TestDoctorCommand:
                         console = mock_console.return_value
                         calls = [str(call) for call in console.print.call_args_list]
                         assert any("full diagnostics" in str(call).lower() for call in calls)
+
+    def test_doctor_skips_model_check_outside_project(self) -> None:
+        """Doctor should not inspect the model cache outside a project without --fix."""
+        mock_report = EnvironmentReport(
+            python=EnvironmentStatus("Python", "pass", "3.11.4"),
+            uv=EnvironmentStatus("uv", "pass", "0.4.12"),
+            nest=EnvironmentStatus("Nest", "pass", "1.0.0"),
+        )
+
+        with patch("nest.cli.doctor_cmd.DoctorService") as MockService:
+            with patch("nest.cli.doctor_cmd.display_doctor_report") as mock_display:
+                with patch("nest.cli.doctor_cmd.ProjectChecker") as MockChecker:
+                    with patch("nest.cli.doctor_cmd.get_console") as mock_console:
+                        MockChecker.return_value.has_project_markers.return_value = False
+                        mock_service = MockService.return_value
+                        mock_service.check_environment.return_value = mock_report
+
+                        from nest.cli.doctor_cmd import doctor_command
+
+                        doctor_command(fix=False)
+
+                        mock_service.check_ml_models.assert_not_called()
+                        mock_display.assert_called_once_with(
+                            mock_report, unittest.mock.ANY, None, None
+                        )
+                        calls = [
+                            str(call) for call in mock_console.return_value.print.call_args_list
+                        ]
+                        hints = [call for call in calls if "ℹ" in call]
+                        assert len(hints) == 1
+                        assert "models not checked" in hints[0].lower()
+                        assert "full diagnostics" in hints[0].lower()
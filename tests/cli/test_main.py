@@ -0,0 +1,45 @@
+"""Tests for the lazily dispatched command stubs in nest.cli.main."""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+import typer
+
+from nest.cli import main
+from nest.cli.doctor_cmd import doctor_command
+from nest.cli.init_cmd import init_command
+from nest.cli.status_cmd import status_command
+from nest.cli.sync_cmd import sync_command
+from nest.cli.update_cmd import update_command
+
+
+def _describe(func: Callable[..., None]) -> tuple[Any, ...]:
+    """Build the Click command Typer would generate for func and summarize it."""
+    single = typer.Typer()
+    single.command()(func)
+    command = typer.main.get_command(single)
+    params = [
+        (param.name, tuple(param.opts), param.default, getattr(param, "help", None))
+        for param in command.params
+    ]
+    return command.help, params
+
+
+@pytest.mark.parametrize(
+    ("name", "command"),
+    [
+        ("init", init_command),
+        ("sync", sync_command),
+        ("status", status_command),
+        ("doctor", doctor_command),
+        ("update", update_command),
+    ],
+)
+def test_stub_matches_command(name: str, command: Callable[..., None]) -> None:
+    """Stubs must declare the same options and help as the commands they dispatch to."""
+    group = typer.main.get_group(main.app)
+    stub = group.commands[name].callback
+    assert stub is not None
+
+    assert _describe(stub) == _describe(command)
@@ -1,40 +1,18 @@
 """Tests for sync command CLI."""
 
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
-import typer
 from typer.testing import CliRunner
 
 from nest.cli.main import app
-from nest.cli.sync_cmd import _display_sync_summary, _validate_on_error
-from nest.core.models import SyncResult
+from nest.cli.sync_cmd import _display_sync_summary
+from nest.core.models import DryRunResult, SyncResult
 from nest.core.paths import AI_SEEN_MARKER, NEST_META_DIR
 
 runner = CliRunner()
 
 
-class TestValidateOnError:
-    """Tests for --on-error validation."""
-
-    def test_valid_skip_value(self) -> None:
-        """'skip' should be accepted."""
-        result = _validate_on_error("skip")
-        assert result == "skip"
-
-    def test_valid_fail_value(self) -> None:
-        """'fail' should be accepted."""
-        result = _validate_on_error("fail")
-        assert result == "fail"
-
-    def test_invalid_value_raises_bad_parameter(self) -> None:
-        """Invalid values should raise BadParameter."""
-        import pytest
-
-        with pytest.raises(typer.BadParameter, match="Must be 'skip' or 'fail'"):
-            _validate_on_error("invalid")
-
-
 class TestSyncCommandHelp:
     """Tests for sync command help text."""
 
@@ -67,12 +45,68 @@ class TestSyncCommandFlags:
         # Check that it didn't fail due to flag parsing
         assert "--dry-run" not in result.output or "error" not in result.output.lower()
 
+    def test_invalid_on_error_rejected_at_parse_time(self) -> None:
+        """--on-error only accepts 'skip' or 'fail'."""
+        result = runner.invoke(app, ["sync", "--on-error", "invalid"])
+
+        assert result.exit_code == 2
+        assert "'invalid' is not one of" in result.output
+
     def test_force_flag_accepted(self) -> None:
         """--force flag should be parsed."""
         result = runner.invoke(app, ["sync", "--force"])
         # Check that it didn't fail due to flag parsing
         assert "--force" not in result.output or "error" not in result.output.lower()
 
+    def test_dry_run_does_not_set_up_error_logger(self, tmp_path: Path) -> None:
+        """--dry-run is read-only: no error logger and no logger passed to the service."""
+        (tmp_path / NEST_META_DIR).mkdir()
+        (tmp_path / NEST_META_DIR / "manifest.json").write_text("{}")
+
+        with (
+            patch("nest.cli.sync_cmd.create_sync_service") as mock_create,
+            patch("nest.ui.logger.setup_error_logger") as mock_setup,
+        ):
+            mock_create.return_value.sync.return_value = DryRunResult()
+            result = runner.invoke(app, ["sync", "--dry-run", "--dir", str(tmp_path)])
+
+        assert result.exit_code == 0
+        mock_setup.assert_not_called()
+        assert mock_create.call_args.kwargs["error_logger"] is None
+
+    def test_plain_string_on_error_is_honoured(self, tmp_path: Path) -> None:
+        """Calling sync_command directly with on_error="fail" keeps fail mode."""
+        from nest.cli.sync_cmd import sync_command
+
+        (tmp_path / NEST_META_DIR).mkdir()
+        (tmp_path / NEST_META_DIR / "manifest.json").write_text("{}")
+
+        with patch("nest.cli.sync_cmd.create_sync_service") as mock_create:
+            mock_create.return_value.sync.return_value = DryRunResult()
+            sync_command(on_error="fail", dry_run=True, target_dir=tmp_path)  # type: ignore[arg-type]
+
+        assert mock_create.return_value.sync.call_args.kwargs["on_error"] == "fail"
+
+    def test_workers_flag_sets_max_workers(self, tmp_path: Path) -> None:
+        """--workers is passed to the service factory as max_workers."""
+        (tmp_path / NEST_META_DIR).mkdir()
+        (tmp_path / NEST_META_DIR / "manifest.json").write_text("{}")
+
+        with patch("nest.cli.sync_cmd.create_sync_service") as mock_create:
+            mock_create.return_value.sync.return_value = DryRunResult()
+            result = runner.invoke(
+                app, ["sync", "--dry-run", "--workers", "2", "--dir", str(tmp_path)]
+            )
+
+        assert result.exit_code == 0
+        assert mock_create.call_args.kwargs["max_workers"] == 2
+
+    def test_workers_flag_rejects_zero(self) -> None:
+        """--workers must be at least 1."""
+        result = runner.invoke(app, ["sync", "--workers", "0"])
+
+        assert result.exit_code != 0
+
 
 class TestSyncProjectValidation:
     """Tests for project validation (AC: #3)."""
@@ -109,6 +143,7 @@ class TestDisplaySyncSummaryAggregatedTokens:
         console.print.side_effect = lambda *args, **kwargs: output_lines.append(
             " ".join(str(a) for a in args)
         )
+        console.out.side_effect = console.print.side_effect
         return console, output_lines
 
     def test_display_sync_summary_shows_aggregated_tokens(self) -> None:
@@ -217,6 +252,7 @@ class TestDisplaySyncSummaryFirstRun:
         console.print.side_effect = lambda *args, **kwargs: output_lines.append(
             " ".join(str(a) for a in args)
         )
+        console.out.side_effect = console.print.side_effect
         return console, output_lines
 
     def test_display_sync_summary_shows_first_run_message(self, tmp_path: Path) -> None:
@@ -325,6 +361,7 @@ class TestDisplaySyncSummaryVisionStats:
         console.print.side_effect = lambda *args, **kwargs: output_lines.append(
             " ".join(str(a) for a in args)
         )
+        console.out.side_effect = console.print.side_effect
         return console, output_lines
 
     def test_images_described_with_mermaid(self) -> None:
@@ -3,11 +3,13 @@
 This module provides reusable fixtures for testing Nest components.
 """
 
+from collections.abc import Iterator
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
-from nest.core.models import Manifest
+from nest.core.models import Manifest, ProcessingResult
 
 
 class MockFileSystem:
@@ -165,3 +167,22 @@ def mock_model_downloader() -> MockModelDownloader:
 def mock_model_downloader_cached() -> MockModelDownloader:
     """Provide a MockModelDownloader with models already cached."""
     return MockModelDownloader(models_cached=True)
+
+
+def stream_process_files(output: Mock) -> None:
+    """Wire a mocked OutputMirrorService's process_files to its process_file.
+
+    Mirrors the real ``process_files`` contract: results stream in input order
+    and per-file exceptions become failed ProcessingResults. Tests can keep
+    configuring and asserting on ``output.process_file``.
+    """
+
+    def process_files(sources: list[Path], raw_dir: Path, output_dir: Path) -> Iterator:
+        for source in sources:
+            try:
+                result = output.process_file(source, raw_dir, output_dir)
+            except Exception as e:
+                result = ProcessingResult(source_path=source, status="failed", error=str(e))
+            yield result
+
+    output.process_files.side_effect = process_files
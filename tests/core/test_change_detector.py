@@ -118,3 +118,12 @@ class TestFileChangeDetector:
         # Act & Assert
         with pytest.raises(ValueError, match="Path must be relative"):
             detector.classify(abs_path, "hash")
+
+    def test_classify_key_matches_classify(self) -> None:
+        """Verify classify_key gives the same status from the manifest key."""
+        manifest_files = {"docs/a.pdf": "hash_a", "docs/b.pdf": "hash_b"}
+        detector = FileChangeDetector(manifest_files)
+
+        assert detector.classify_key("docs/a.pdf", "hash_a") == "unchanged"
+        assert detector.classify_key("docs/b.pdf", "other") == "modified"
+        assert detector.classify_key("docs/c.pdf", "hash_c") == "new"
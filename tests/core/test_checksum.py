@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from nest.core.checksum import compute_sha256
+from nest.core.checksum import compute_sha256, compute_sha256_many
 
 
 class TestComputeSha256:
@@ -107,3 +107,49 @@ class TestComputeSha256:
 
         # Assert
         assert result == expected_hash
+
+    def test_file_larger_than_default_chunk_matches_hashlib(self, tmp_path: Path) -> None:
+        """Verify files spanning several default-sized chunks hash correctly."""
+        # Arrange - 1 MiB + 1 byte, so a second, partial chunk is read
+        test_content = bytes(range(256)) * 4096 + b"!"
+        expected_hash = hashlib.sha256(test_content).hexdigest()
+        test_file = tmp_path / "mapped.bin"
+        test_file.write_bytes(test_content)
+
+        # Act
+        result = compute_sha256(test_file)
+
+        # Assert
+        assert result == expected_hash
+
+
+class TestComputeSha256Many:
+    """Tests for compute_sha256_many function."""
+
+    def test_matches_single_file_hashes(self, tmp_path: Path) -> None:
+        """Verify batch hashing agrees with compute_sha256 on the thread pool path."""
+        # Arrange - enough files to use the thread pool
+        files = []
+        for i in range(8):
+            file_path = tmp_path / f"file{i}.txt"
+            file_path.write_bytes(f"content {i}".encode())
+            files.append(file_path)
+
+        # Act
+        result = compute_sha256_many(files)
+
+        # Assert
+        assert result == {file_path: compute_sha256(file_path) for file_path in files}
+
+    def test_omits_unreadable_files(self, tmp_path: Path) -> None:
+        """Verify missing files are left out instead of raising."""
+        # Arrange
+        present = tmp_path / "present.txt"
+        present.write_bytes(b"here")
+        missing = tmp_path / "missing.txt"
+
+        # Act
+        result = compute_sha256_many([present, missing])
+
+        # Assert
+        assert list(result) == [present]
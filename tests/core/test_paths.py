@@ -5,6 +5,8 @@ Tests the pure path manipulation functions used for output mirroring.
 
 from pathlib import Path
 
+import pytest
+
 from nest.core.paths import (
     ALL_SOURCE_EXTENSIONS,
     CONTEXT_TEXT_EXTENSIONS,
@@ -124,6 +126,35 @@ class TestMirrorPath:
             result = mirror_path(source, source_root, target_root)
             assert result.suffix == ".md", f"Failed for {ext}"
 
+    def test_matches_pathlib_suffix_rules(self) -> None:
+        """Only the last suffix is replaced; dotted dirs and dotfiles keep their names."""
+        source_root = Path("/project/raw_inbox")
+        target_root = Path("/project/processed_context")
+
+        for name in ["archive.tar.gz", "v1.2/notes.pdf", "docs/.hidden", "README"]:
+            source = source_root / name
+            expected = target_root / Path(name).with_suffix(".md")
+            assert mirror_path(source, source_root, target_root) == expected, name
+
+    def test_dot_edge_names_match_with_suffix(self) -> None:
+        """Names with leading or trailing dots get the same path as Path.with_suffix."""
+        source_root = Path("/project/raw_inbox")
+        target_root = Path("/project/processed_context")
+
+        for name in ["file.", "a..", "sub/report.v2.", "..a", "sub/...b"]:
+            source = source_root / name
+            expected = target_root / Path(name).with_suffix(".md")
+            assert mirror_path(source, source_root, target_root) == expected, name
+
+    def test_source_outside_root_raises(self) -> None:
+        """Sources outside source_root (including sibling prefixes) raise ValueError."""
+        source_root = Path("/project/raw_inbox")
+        target_root = Path("/project/processed_context")
+
+        for source in [Path("/project/raw_inbox2/doc.pdf"), Path("/other/doc.pdf")]:
+            with pytest.raises(ValueError, match="subpath"):
+                mirror_path(source, source_root, target_root)
+
 
 class TestRelativeToProject:
     """Tests for relative_to_project function."""
@@ -216,6 +247,14 @@ class TestSourcePathToManifestKey:
 
         assert result == "My Important Document.pdf"
 
+    def test_source_outside_raw_inbox_raises(self) -> None:
+        """Sources outside raw_inbox (including sibling prefixes) raise ValueError."""
+        raw_inbox = Path("/project/raw_inbox")
+
+        for source in [Path("/project/raw_inbox2/doc.pdf"), Path("/other/doc.pdf")]:
+            with pytest.raises(ValueError, match="subpath"):
+                source_path_to_manifest_key(source, raw_inbox)
+
 
 class TestAllSourceExtensions:
     """Tests for ALL_SOURCE_EXTENSIONS constant."""
@@ -0,0 +1,33 @@
+"""E2E tests for DoclingProcessor's process-pool batch conversion."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from .conftest import skip_without_docling
+
+
+@pytest.mark.e2e
+@skip_without_docling
+class TestDoclingBatchE2E:
+    """Batch conversion with real Docling worker processes."""
+
+    def test_worker_pool_converts_all_jobs(self, tmp_path: Path) -> None:
+        """Multiple workers convert every job and keep input order."""
+        from nest.adapters.docling_processor import DoclingProcessor
+
+        jobs: list[tuple[Path, Path]] = []
+        for name in ("one", "two"):
+            source = tmp_path / f"{name}.html"
+            source.write_text(f"<html><body><h1>{name}</h1></body></html>")
+            jobs.append((source, tmp_path / "out" / f"{name}.md"))
+        missing = tmp_path / "missing.html"
+        jobs.append((missing, tmp_path / "out" / "missing.md"))
+
+        results = list(DoclingProcessor().process_batch(jobs, max_workers=2))
+
+        assert [r.source_path for r in results] == [source for source, _ in jobs]
+        assert [r.status for r in results] == ["success", "success", "failed"]
+        assert "one" in (tmp_path / "out" / "one.md").read_text()
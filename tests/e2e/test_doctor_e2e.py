@@ -28,23 +28,23 @@ class TestDoctorE2E:
         assert "Nest:" in result.stdout
 
     @skip_without_docling
-    def test_doctor_shows_model_status(self, fresh_temp_dir: Path) -> None:
-        """Test that doctor displays ML Models section.
+    def test_doctor_shows_model_status(self, initialized_project: Path) -> None:
+        """Test that doctor displays ML Models section inside a project.
 
         Note: In CI/dev environments, models are typically cached, so we expect
         to see either "cached" or "not found" status. The important thing is
         that the section appears.
         """
-        result = run_cli(["doctor"], cwd=fresh_temp_dir, timeout=30)
+        result = run_cli(["doctor"], cwd=initialized_project, timeout=30)
 
         assert result.exit_code == 0
         assert "ML Models" in result.stdout
         assert "Models:" in result.stdout
 
     @skip_without_docling
-    def test_doctor_shows_model_cache_path(self, fresh_temp_dir: Path) -> None:
+    def test_doctor_shows_model_cache_path(self, initialized_project: Path) -> None:
         """Test that doctor displays cache path for ML models."""
-        result = run_cli(["doctor"], cwd=fresh_temp_dir, timeout=30)
+        result = run_cli(["doctor"], cwd=initialized_project, timeout=30)
 
         assert result.exit_code == 0
         assert "Cache path:" in result.stdout
@@ -71,7 +71,7 @@ class TestDoctorE2E:
         # But should NOT show Project section
         assert "Manifest:" not in result.stdout
         # Should show hint message
-        assert "Run in a Nest project for full diagnostics" in result.stdout
+        assert "run in a Nest project for full diagnostics" in result.stdout
 
     def test_doctor_detects_missing_manifest(self, initialized_project: Path) -> None:
         """Test that doctor detects and reports missing manifest."""
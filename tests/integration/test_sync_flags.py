@@ -8,6 +8,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from conftest import stream_process_files
 from nest.core.models import (
     DiscoveredFile,
     DiscoveryResult,
@@ -26,6 +27,7 @@ class TestSyncDryRunIntegration:
         # Setup mocks
         mock_discovery = Mock()
         mock_output = Mock()
+        stream_process_files(mock_output)
         mock_manifest = Mock()
         mock_orphan = Mock()
         mock_index = Mock()
@@ -101,6 +103,7 @@ class TestSyncForceIntegration:
         """Force should reprocess files even if unchanged."""
         mock_discovery = Mock()
         mock_output = Mock()
+        stream_process_files(mock_output)
         mock_manifest = Mock()
         mock_orphan = Mock()
         mock_index = Mock()
@@ -165,6 +168,7 @@ class TestSyncOnErrorIntegration:
         """Skip mode should continue processing after failures."""
         mock_discovery = Mock()
         mock_output = Mock()
+        stream_process_files(mock_output)
         mock_manifest = Mock()
         mock_orphan = Mock()
         mock_index = Mock()
@@ -239,6 +243,7 @@ class TestSyncOnErrorIntegration:
 
         mock_discovery = Mock()
         mock_output = Mock()
+        stream_process_files(mock_output)
         mock_manifest = Mock()
         mock_orphan = Mock()
         mock_index = Mock()
@@ -303,6 +308,7 @@ class TestErrorLoggingIntegration:
 
         mock_discovery = Mock()
         mock_output = Mock()
+        stream_process_files(mock_output)
         mock_manifest = Mock()
         mock_orphan = Mock()
         mock_index = Mock()
@@ -370,6 +376,7 @@ class TestErrorLoggingIntegration:
 
         mock_discovery = Mock()
         mock_output = Mock()
+        stream_process_files(mock_output)
         mock_manifest = Mock()
         mock_orphan = Mock()
         mock_index = Mock()
@@ -433,6 +440,7 @@ class TestSyncFlagCombinations:
         """--force --dry-run should show all files as modified."""
         mock_discovery = Mock()
         mock_output = Mock()
+        stream_process_files(mock_output)
         mock_manifest = Mock()
         mock_orphan = Mock()
         mock_index = Mock()
@@ -491,6 +499,7 @@ class TestSyncFlagCombinations:
         """--no-clean --dry-run should work (dry-run takes precedence)."""
         mock_discovery = Mock()
         mock_output = Mock()
+        stream_process_files(mock_output)
         mock_manifest = Mock()
         mock_orphan = Mock()
         mock_index = Mock()
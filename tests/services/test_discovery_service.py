@@ -1,5 +1,6 @@
 """Tests for discovery service."""
 
+import os
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock
@@ -326,13 +327,135 @@ class TestDiscoveryService:
         )
 
         # Act
-        with patch("nest.services.discovery_service.compute_sha256") as mock_checksum:
+        with patch("nest.core.checksum.compute_sha256") as mock_checksum:
             mock_checksum.side_effect = PermissionError("Locked")
             result = service.discover_changes(tmp_path)
 
         # Assert
         assert result.total_count == 0
 
+    def test_skips_hashing_when_size_and_mtime_match_manifest(self, tmp_path: Path) -> None:
+        """Verify a file whose stat matches its manifest entry is not re-hashed."""
+        from unittest.mock import patch
+
+        sources = tmp_path / "_nest_sources"
+        sources.mkdir()
+        pdf_file = sources / "doc.pdf"
+        pdf_file.write_bytes(b"pdf content")
+        os.utime(pdf_file, (1_700_000_000, 1_700_000_000))
+        stat = pdf_file.stat()
+
+        mock_discovery = Mock(spec=FileDiscoveryProtocol)
+        mock_discovery.discover.return_value = [pdf_file]
+
+        mock_manifest = Mock(spec=ManifestProtocol)
+        mock_manifest.load.return_value = Manifest(
+            nest_version="0.1.0",
+            files={
+                "doc.pdf": FileEntry(
+                    sha256="recorded_checksum",
+                    processed_at=datetime.now(),
+                    output="doc.md",
+                    status="success",
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                )
+            },
+        )
+
+        service = DiscoveryService(
+            file_discovery=mock_discovery,
+            manifest=mock_manifest,
+        )
+
+        with patch("nest.core.checksum.compute_sha256") as mock_checksum:
+            result = service.discover_changes(tmp_path)
+
+        mock_checksum.assert_not_called()
+        assert len(result.unchanged_files) == 1
+        assert result.unchanged_files[0].checksum == "recorded_checksum"
+        assert result.unchanged_files[0].mtime_ns == stat.st_mtime_ns
+        assert result.unchanged_files[0].size == stat.st_size
+
+    def test_rehashes_file_modified_just_before_discovery(self, tmp_path: Path) -> None:
+        """Verify a too-fresh mtime is not trusted and not offered for caching."""
+        import hashlib
+
+        sources = tmp_path / "_nest_sources"
+        sources.mkdir()
+        pdf_file = sources / "doc.pdf"
+        pdf_file.write_bytes(b"pdf content")
+        stat = pdf_file.stat()
+
+        mock_discovery = Mock(spec=FileDiscoveryProtocol)
+        mock_discovery.discover.return_value = [pdf_file]
+
+        mock_manifest = Mock(spec=ManifestProtocol)
+        mock_manifest.load.return_value = Manifest(
+            nest_version="0.1.0",
+            files={
+                "doc.pdf": FileEntry(
+                    sha256="recorded_checksum",
+                    processed_at=datetime.now(),
+                    output="doc.md",
+                    status="success",
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                )
+            },
+        )
+
+        service = DiscoveryService(
+            file_discovery=mock_discovery,
+            manifest=mock_manifest,
+        )
+
+        result = service.discover_changes(tmp_path)
+
+        assert len(result.modified_files) == 1
+        modified = result.modified_files[0]
+        assert modified.checksum == hashlib.sha256(b"pdf content").hexdigest()
+        assert modified.mtime_ns is None
+        assert modified.size is None
+
+    def test_force_hashes_even_when_stat_matches(self, tmp_path: Path) -> None:
+        """Verify force mode ignores the stat shortcut and re-hashes."""
+        import hashlib
+
+        sources = tmp_path / "_nest_sources"
+        sources.mkdir()
+        pdf_file = sources / "doc.pdf"
+        pdf_file.write_bytes(b"pdf content")
+        stat = pdf_file.stat()
+
+        mock_discovery = Mock(spec=FileDiscoveryProtocol)
+        mock_discovery.discover.return_value = [pdf_file]
+
+        mock_manifest = Mock(spec=ManifestProtocol)
+        mock_manifest.load.return_value = Manifest(
+            nest_version="0.1.0",
+            files={
+                "doc.pdf": FileEntry(
+                    sha256="recorded_checksum",
+                    processed_at=datetime.now(),
+                    output="doc.md",
+                    status="success",
+                    mtime_ns=stat.st_mtime_ns,
+                    size=stat.st_size,
+                )
+            },
+        )
+
+        service = DiscoveryService(
+            file_discovery=mock_discovery,
+            manifest=mock_manifest,
+        )
+
+        result = service.discover_changes(tmp_path, force=True)
+
+        assert len(result.modified_files) == 1
+        assert result.modified_files[0].checksum == hashlib.sha256(b"pdf content").hexdigest()
+
 
 class TestDiscoveryServiceTextFiles:
     """Tests for discovery of passthrough text files (Story 2.12)."""
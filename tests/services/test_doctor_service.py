@@ -248,6 +248,16 @@ class TestCheckEnvironment:
 
         assert report.all_pass is False
 
+    def test_checks_lists_statuses_in_display_order(self) -> None:
+        """checks should yield python, uv, nest in that order."""
+        report = EnvironmentReport(
+            python=EnvironmentStatus("Python", "pass", "3.11.4"),
+            uv=EnvironmentStatus("uv", "pass", "0.4.12"),
+            nest=EnvironmentStatus("Nest", "pass", "1.0.0"),
+        )
+
+        assert [check.name for check in report.checks] == ["Python", "uv", "Nest"]
+
 
 class MockModelChecker:
     """Mock implementation of ModelCheckerProtocol for testing."""
@@ -536,6 +546,16 @@ class MockProjectChecker:
         """Check if .nest/ metadata folder exists."""
         return self._meta_folder_exists
 
+    def has_project_markers(self, project_dir: Path) -> bool:
+        """Check if any project marker exists."""
+        return (
+            self._manifest_exists
+            or self._has_legacy_layout
+            or self._agent_exists
+            or self._sources_exist
+            or self._context_exist
+        )
+
     def has_legacy_layout(self, project_dir: Path) -> bool:
         """Check if legacy layout detected."""
         return self._has_legacy_layout
@@ -918,6 +938,7 @@ class TestRebuildManifest:
         mock_fs = MagicMock()
         mock_fs.list_files.return_value = [source_file]
         mock_fs.exists.return_value = True
+        mock_fs.exists_many.side_effect = lambda paths: [path.exists() for path in paths]
 
         service = DoctorService(manifest_adapter=mock_manifest, filesystem=mock_fs)
         result = service.rebuild_manifest(tmp_path)
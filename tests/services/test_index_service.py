@@ -189,26 +189,16 @@ class TestWriteIndex:
         expected_path = Path("/app/.nest/00_MASTER_INDEX.md")
         fs.write_text.assert_called_once_with(expected_path, "test content")
 
-    def test_creates_directory_if_not_exists(self):
-        """Should create .nest/ directory if it doesn't exist."""
+    def test_does_not_probe_meta_directory(self):
+        """Should leave .nest/ creation to write_text instead of probing first."""
         fs = Mock(spec=FileSystemProtocol)
-        fs.exists.return_value = False
-        service = IndexService(filesystem=fs, project_root=Path("/app"))
-
-        service.write_index("test content")
-
-        fs.create_directory.assert_called_once_with(Path("/app/.nest"))
-        fs.write_text.assert_called_once()
-
-    def test_skips_directory_creation_if_exists(self):
-        """Should not create directory if it already exists."""
-        fs = Mock(spec=FileSystemProtocol)
-        fs.exists.return_value = True
         service = IndexService(filesystem=fs, project_root=Path("/app"))
 
         service.write_index("test content")
 
+        fs.exists.assert_not_called()
         fs.create_directory.assert_not_called()
+        fs.write_text.assert_called_once()
 
 
 class TestReadIndexContent:
@@ -6,7 +6,7 @@ Tests manifest tracking and updates during sync operations.
 from datetime import datetime, timezone
 from pathlib import Path
 
-from nest.core.models import FileEntry, Manifest
+from nest.core.models import DiscoveredFile, FileEntry, Manifest
 from nest.services.manifest_service import ManifestService
 
 
@@ -382,3 +382,73 @@ class TestManifestServiceCommit:
 
         # Assert
         assert mock_adapter.save_called
+
+
+class TestManifestServiceSourceStats:
+    """Tests for ManifestService.record_source_stats()."""
+
+    def _service(self, entry: FileEntry) -> tuple[ManifestService, MockManifestAdapter]:
+        mock_adapter = MockManifestAdapter(
+            existing_manifest=Manifest(nest_version="1.0.0", files={"doc.pdf": entry})
+        )
+        service = ManifestService(
+            manifest=mock_adapter,
+            project_root=Path("/project"),
+            raw_inbox=Path("/project/raw_inbox"),
+            output_dir=Path("/project/processed_context"),
+        )
+        return service, mock_adapter
+
+    def test_commit_stores_stat_on_entry_with_matching_checksum(self) -> None:
+        """Stats are attached when the entry's checksum is the one hashed."""
+        entry = FileEntry(
+            sha256="abc123",
+            processed_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            output="doc.md",
+            status="success",
+        )
+        service, mock_adapter = self._service(entry)
+        service.record_source_stats(
+            [
+                DiscoveredFile(
+                    path=Path("/project/raw_inbox/doc.pdf"),
+                    status="unchanged",
+                    checksum="abc123",
+                    mtime_ns=1_700_000_000_000_000_000,
+                    size=42,
+                )
+            ]
+        )
+
+        service.commit()
+
+        saved = mock_adapter.saved_manifest.files["doc.pdf"]
+        assert saved.mtime_ns == 1_700_000_000_000_000_000
+        assert saved.size == 42
+
+    def test_commit_ignores_stat_when_checksum_differs(self) -> None:
+        """A changed file that was not recorded must not look unchanged."""
+        entry = FileEntry(
+            sha256="old_checksum",
+            processed_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            output="doc.md",
+            status="success",
+        )
+        service, mock_adapter = self._service(entry)
+        service.record_source_stats(
+            [
+                DiscoveredFile(
+                    path=Path("/project/raw_inbox/doc.pdf"),
+                    status="modified",
+                    checksum="new_checksum",
+                    mtime_ns=1_700_000_000_000_000_000,
+                    size=42,
+                )
+            ]
+        )
+
+        service.commit()
+
+        saved = mock_adapter.saved_manifest.files["doc.pdf"]
+        assert saved.mtime_ns is None
+        assert saved.size is None
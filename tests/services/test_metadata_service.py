@@ -366,12 +366,12 @@ class TestWriteHints:
         assert parsed["files"][0]["content_hash"] == "abc123"
         assert parsed["files"][0]["lines"] == 42
 
-    def test_creates_parent_directory_if_missing(self):
-        """Should create parent directory if it doesn't exist."""
+    def test_does_not_probe_parent_directory(self):
+        """Should leave parent creation to write_text instead of probing first."""
         fs = Mock(spec=FileSystemProtocol)
-        fs.exists.return_value = False
         service = MetadataExtractorService(filesystem=fs, project_root=Path("/app"))
 
         service.write_hints([], Path("/app/.nest/00_INDEX_HINTS.yaml"))
 
-        fs.create_directory.assert_called_once_with(Path("/app/.nest"))
+        fs.exists.assert_not_called()
+        fs.create_directory.assert_not_called()
@@ -7,7 +7,13 @@ document processing, routing files by extension.
 from pathlib import Path
 from unittest.mock import Mock
 
-from nest.adapters.protocols import DocumentProcessorProtocol, FileSystemProtocol
+import pytest
+
+from nest.adapters.protocols import (
+    BatchDocumentProcessorProtocol,
+    DocumentProcessorProtocol,
+    FileSystemProtocol,
+)
 from nest.core.models import ProcessingResult
 from nest.services.output_service import OutputMirrorService
 
@@ -316,3 +322,107 @@ class TestOutputMirrorServicePassthrough:
 
         assert result.status == "failed"
         assert "not configured" in result.error
+
+
+class TestOutputMirrorServiceProcessFiles:
+    """Tests for batched processing via process_files."""
+
+    def test_uses_process_batch_when_processor_supports_it(self) -> None:
+        """Docling-only batches are handed to process_batch in one call."""
+        mock_fs = Mock(spec=FileSystemProtocol)
+        mock_fs.compute_output_path.side_effect = lambda s, r, o: o / s.with_suffix(".md").name
+        mock_docling = Mock(spec=BatchDocumentProcessorProtocol)
+        mock_docling.process_batch.return_value = iter(
+            [
+                ProcessingResult(source_path=Path("/in/a.pdf"), status="success"),
+                ProcessingResult(source_path=Path("/in/b.pdf"), status="success"),
+            ]
+        )
+
+        service = OutputMirrorService(mock_fs, mock_docling)
+
+        results = list(
+            service.process_files([Path("/in/a.pdf"), Path("/in/b.pdf")], Path("/in"), Path("/out"))
+        )
+
+        assert [r.source_path for r in results] == [Path("/in/a.pdf"), Path("/in/b.pdf")]
+        mock_docling.process_batch.assert_called_once_with(
+            [
+                (Path("/in/a.pdf"), Path("/out/a.md")),
+                (Path("/in/b.pdf"), Path("/out/b.md")),
+            ]
+        )
+
+    def test_falls_back_to_process_file_without_batch_support(self) -> None:
+        """Processors without process_batch are called once per file, in order."""
+        mock_fs = Mock(spec=FileSystemProtocol)
+        mock_fs.compute_output_path.return_value = Path("/out/doc.md")
+        mock_docling = Mock(spec=DocumentProcessorProtocol)
+        mock_docling.process.side_effect = lambda source, output: ProcessingResult(
+            source_path=source, status="success", output_path=output
+        )
+
+        service = OutputMirrorService(mock_fs, mock_docling)
+
+        results = list(
+            service.process_files([Path("/in/a.pdf"), Path("/in/b.pdf")], Path("/in"), Path("/out"))
+        )
+
+        assert [r.source_path for r in results] == [Path("/in/a.pdf"), Path("/in/b.pdf")]
+        assert mock_docling.process.call_count == 2
+
+    def test_exception_becomes_failed_result(self, caplog: pytest.LogCaptureFixture) -> None:
+        """An unexpected exception for one file doesn't abort the rest."""
+        mock_fs = Mock(spec=FileSystemProtocol)
+        mock_fs.compute_output_path.return_value = Path("/out/doc.md")
+        mock_docling = Mock(spec=DocumentProcessorProtocol)
+        mock_docling.process.side_effect = [
+            RuntimeError("boom"),
+            ProcessingResult(source_path=Path("/in/b.pdf"), status="success"),
+        ]
+
+        service = OutputMirrorService(mock_fs, mock_docling)
+
+        results = list(
+            service.process_files([Path("/in/a.pdf"), Path("/in/b.pdf")], Path("/in"), Path("/out"))
+        )
+
+        assert results[0].status == "failed"
+        assert results[0].error == "boom"
+        assert results[1].status == "success"
+        assert "Unexpected error processing" in caplog.text
+        assert "RuntimeError: boom" in caplog.text
+
+    def test_output_path_error_fails_only_that_file_in_batch(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A bad output path fails one file; the rest still go to process_batch in order."""
+        mock_fs = Mock(spec=FileSystemProtocol)
+
+        def compute_output_path(source: Path, raw_dir: Path, output_dir: Path) -> Path:
+            if source.name == "bad.pdf":
+                raise ValueError("bad path")
+            return output_dir / source.with_suffix(".md").name
+
+        mock_fs.compute_output_path.side_effect = compute_output_path
+        mock_docling = Mock(spec=BatchDocumentProcessorProtocol)
+        mock_docling.process_batch.side_effect = lambda jobs: iter(
+            ProcessingResult(source_path=source, status="success", output_path=output)
+            for source, output in jobs
+        )
+
+        service = OutputMirrorService(mock_fs, mock_docling)
+
+        sources = [Path("/in/a.pdf"), Path("/in/bad.pdf"), Path("/in/c.pdf")]
+        results = list(service.process_files(sources, Path("/in"), Path("/out")))
+
+        assert [r.source_path for r in results] == sources
+        assert [r.status for r in results] == ["success", "failed", "success"]
+        assert results[1].error == "bad path"
+        mock_docling.process_batch.assert_called_once_with(
+            [
+                (Path("/in/a.pdf"), Path("/out/a.md")),
+                (Path("/in/c.pdf"), Path("/out/c.md")),
+            ]
+        )
+        assert "Unexpected error processing" in caplog.text
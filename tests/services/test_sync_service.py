@@ -5,6 +5,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from conftest import stream_process_files
 from nest.core.models import (
     DiscoveredFile,
     DiscoveryResult,
@@ -48,9 +49,12 @@ def mock_deps():
         "<!-- nest:index-table-end -->\n"
     )
 
+    output_mock = Mock(spec=OutputMirrorService)
+    stream_process_files(output_mock)
+
     return {
         "discovery": Mock(spec=DiscoveryService),
-        "output": Mock(spec=OutputMirrorService),
+        "output": output_mock,
         "manifest": Mock(spec=ManifestService),
         "orphan": orphan_mock,
         "index": index_mock,
@@ -460,7 +464,9 @@ class TestSyncOnErrorMode:
         assert "fail.pdf" in str(exc_info.value)
 
     def test_fail_mode_raises_on_exception(self, mock_deps):
-        """on_error=fail should re-raise exceptions immediately."""
+        """on_error=fail should abort with ProcessingError on unexpected exceptions."""
+        from nest.core.exceptions import ProcessingError
+
         service = _create_sync_service(mock_deps)
 
         mock_deps["discovery"].discover_changes.return_value = DiscoveryResult(
@@ -474,12 +480,34 @@ class TestSyncOnErrorMode:
 
         mock_deps["output"].process_file.side_effect = RuntimeError("Unexpected crash")
 
-        with pytest.raises(RuntimeError, match="Unexpected crash"):
+        with pytest.raises(ProcessingError, match="Unexpected crash"):
             service.sync(on_error="fail")
 
         # Should abort after first exception
         assert mock_deps["output"].process_file.call_count == 1
 
+    def test_fail_mode_passthrough_exception_matches_docling(self, mock_deps):
+        """Passthrough crashes follow the same policy: logged, recorded, ProcessingError."""
+        from nest.core.exceptions import ProcessingError
+
+        service = _create_sync_service(mock_deps)
+
+        mock_deps["discovery"].discover_changes.return_value = DiscoveryResult(
+            new_files=[
+                DiscoveredFile(path=Path("/app/raw/notes.txt"), checksum="111", status="new"),
+            ],
+            modified_files=[],
+            unchanged_files=[],
+        )
+
+        mock_deps["output"].process_file.side_effect = RuntimeError("Unexpected crash")
+
+        with pytest.raises(ProcessingError, match="Unexpected crash"):
+            service.sync(on_error="fail")
+
+        failure_call = mock_deps["manifest"].record_failure.call_args
+        assert "Unexpected crash" in failure_call[0][2]
+
     def test_skip_mode_is_default(self, mock_deps):
         """Default on_error should be skip (continue after failures)."""
         service = _create_sync_service(mock_deps)
@@ -45,6 +45,17 @@ class TestSetupErrorLogger:
 
         assert log_file.exists()
 
+    def test_setup_does_not_create_log_file(self, tmp_path: Path) -> None:
+        """Setup alone leaves no log file behind on a clean run."""
+        from nest.ui.logger import setup_error_logger
+
+        log_file = tmp_path / ".nest" / "errors.log"
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+
+        setup_error_logger(log_file, service_name="sync")
+
+        assert not log_file.exists()
+
     def test_log_format_matches_specification(self, tmp_path: Path) -> None:
         """Test log format: {timestamp} {level} [{service}] {message}."""
         from nest.ui.logger import setup_error_logger
@@ -85,6 +96,34 @@ class TestSetupErrorLogger:
         assert "first error" in lines[0]
         assert "second error" in lines[1]
 
+    def test_repeated_setup_shares_one_file_handler(self, tmp_path: Path) -> None:
+        """Setting up the same log file twice reuses the open handler."""
+        from nest.ui.logger import setup_error_logger
+
+        log_file = tmp_path / ".nest" / "errors.log"
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+
+        logger1 = setup_error_logger(log_file, service_name="sync")
+        logger2 = setup_error_logger(log_file, service_name="sync")
+
+        assert logger1.logger.handlers == logger2.logger.handlers
+        assert len(logger2.logger.handlers) == 1
+
+    def test_removed_log_file_is_reopened(self, tmp_path: Path) -> None:
+        """A deleted log file is recreated on the next setup."""
+        from nest.ui.logger import setup_error_logger
+
+        log_file = tmp_path / ".nest" / "errors.log"
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        setup_error_logger(log_file).error("first")
+        log_file.unlink()
+
+        setup_error_logger(log_file).error("second")
+
+        content = log_file.read_text()
+        assert "second" in content
+        assert "first" not in content
+
     def test_default_log_file_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that default log file is .nest/errors.log in current directory."""
         from nest.ui.logger import setup_error_logger